@@ -0,0 +1 @@
+python3 src/benchmark.py suite --json bench_output.json "$@"
@@ -0,0 +1,16 @@
+import os
+import sys
+
+
+# `python3 -m src` runs this file as part of a package, so the modules beside
+# it are only importable once their directory is on the path; `python3 src`
+# already puts it there.
+directory = os.path.dirname(os.path.abspath(__file__))
+if directory not in sys.path:
+    sys.path.insert(0, directory)
+
+from main import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from build import BuildResult, PageError, _convert_job, _init_worker, convert_page, create_cache, finish_build, plan_build, write_atomic
+from template import Template
+
+
+MAX_OPEN_FILES = 32
+MAX_PENDING    = 128
+
+
+def build_site_async(
+    content_dir:    Path,
+    output_dir:     Path,
+    template_path:  Path,
+    workers:        int | None = None,
+    force:          bool = False,
+    max_open_files: int = MAX_OPEN_FILES,
+    cache_size:     int | None = None
+) -> BuildResult:
+    plan = plan_build(content_dir, output_dir, template_path, force)
+    links = asyncio.run(run_jobs_async(plan.jobs, plan.template, workers, max_open_files, cache_size=cache_size))
+    return finish_build(plan, output_dir, links)
+
+
+async def run_jobs_async(
+    jobs:           list[tuple[Path, Path]],
+    template:       Template,
+    workers:        int | None = None,
+    max_open_files: int = MAX_OPEN_FILES,
+    max_pending:    int = MAX_PENDING,
+    cache_size:     int | None = None
+) -> list[tuple[str, ...]]:
+    # Reads and writes run on a thread pool sized to max_open_files, so no
+    # more files than that are open at once. A page holds a pending slot from
+    # the start of its read until its output is written, which bounds the
+    # markdown and html held in memory when conversion or disks fall behind.
+    if max_open_files <= 0 or max_pending <= 0:
+        raise ValueError("max_open_files and max_pending must be positive")
+
+    loop = asyncio.get_running_loop()
+    pending = asyncio.Semaphore(max_pending)
+    io_pool = ThreadPoolExecutor(max_open_files, thread_name_prefix="ssg-io")
+    convert_pool, convert = create_convert_pool(template, workers, cache_size)
+
+    async def build_page(source: Path, destination: Path) -> tuple[str, ...]:
+        async with pending:
+            markdown = await loop.run_in_executor(io_pool, read_text, source)
+            try:
+                html, targets = await loop.run_in_executor(convert_pool, convert, markdown)
+            except ValueError as error:
+                raise PageError(os.fspath(source), str(error)) from error
+            await loop.run_in_executor(io_pool, write_atomic, destination, html)
+            return targets
+
+    try:
+        return await asyncio.gather(*(build_page(source, destination) for source, destination in jobs))
+    finally:
+        io_pool.shutdown(cancel_futures=True)
+        convert_pool.shutdown(cancel_futures=True)
+
+
+def create_convert_pool(template: Template, workers: int | None = None, cache_size: int | None = None) -> tuple[Executor, Callable[[str], tuple[str, tuple[str, ...]]]]:
+    # A single worker converts on one background thread so the event loop
+    # stays free to schedule reads and writes; more workers get processes that
+    # compile the template once, like the synchronous build.
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return ThreadPoolExecutor(1, thread_name_prefix="ssg-convert"), functools.partial(convert_page, template=template, cache=create_cache(cache_size))
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(template.source, cache_size))
+    return executor, _convert_job
+
+
+def read_text(path: Path) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
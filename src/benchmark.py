@@ -0,0 +1,413 @@
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from block_markdown import BlockType, iter_blocks, iter_html_nodes, markdown_to_html_node, write_markdown_html
+from htmlnode import CachedNode, HTMLNode, LeafNode, ParentNode
+from markdown import split_nodes_image, split_nodes_link, text_to_textnodes
+from spans import spans_to_html, text_to_spans
+from textnode import TextNode, TextType, text_node_to_html, text_node_to_html_node
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def count_nodes(node: HTMLNode) -> int:
+    count, stack = 0, [node]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children or [])
+    return count
+
+
+def link_dense_text(count: int) -> str:
+    return " ".join(f"see [page {i}](/api/{i}.html) and ![icon {i}](/img/{i}.png)" for i in range(count))
+
+
+def bench_link_scaling() -> None:
+    print(f"{'links':>8} {'seconds':>10} {'us/link':>8}")
+    for count in (1_000, 2_000, 4_000, 8_000, 16_000):
+        node = TextNode(link_dense_text(count), TextType.TEXT)
+        seconds = best_of(lambda: split_nodes_link(split_nodes_image([node])))
+        print(f"{count * 2:>8} {seconds:>10.4f} {seconds / (count * 2) * 1e6:>8.2f}")
+
+
+def nested_tree(depth: int, width: int) -> ParentNode:
+    node: HTMLNode = LeafNode("span", "leaf")
+    for _ in range(depth):
+        node = ParentNode("li", [LeafNode("b", "item"), ParentNode("ul", [node]), LeafNode(None, "text")])
+    return ParentNode("div", [node] * width)
+
+
+def recursive_to_html(node: HTMLNode) -> str:
+    if isinstance(node, LeafNode):
+        return node.to_html()
+    children_html = ''
+    for child in node.children or []:
+        children_html += recursive_to_html(child)
+    return f"<{node.tag}{node.props_to_html()}>{children_html}</{node.tag}>"
+
+
+def bench_nested_render() -> None:
+    print(f"{'depth':>8} {'recursive':>10} {'iterative':>10}")
+    for depth in (10, 100, 200, 450):
+        tree = nested_tree(depth, 4000 // depth)
+        recursive = best_of(lambda: recursive_to_html(tree))
+        iterative = best_of(tree.to_html)
+        print(f"{depth:>8} {recursive:>10.4f} {iterative:>10.4f}")
+
+
+class DictTextNode(TextNode):
+    pass
+
+
+class DictLeafNode(LeafNode):
+    pass
+
+
+def allocated_bytes(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    kept = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return allocated
+
+
+def bench_node_memory() -> None:
+    count = 100_000
+    nodes = text_to_textnodes(link_dense_text(10))
+    cases = {
+        "TextNode":     lambda: [TextNode(n.text, n.text_type, n.url) for n in nodes * (count // len(nodes))],
+        "DictTextNode": lambda: [DictTextNode(n.text, n.text_type, n.url) for n in nodes * (count // len(nodes))],
+        "LeafNode":     lambda: [LeafNode("b", n.text) for n in nodes * (count // len(nodes))],
+        "DictLeafNode": lambda: [DictLeafNode("b", n.text) for n in nodes * (count // len(nodes))],
+    }
+    print(f"{'class':>14} {'bytes/node':>10}")
+    for name, build in cases.items():
+        print(f"{name:>14} {allocated_bytes(build) / count:>10.1f}")
+
+
+def link_dense_corpus(size: int, rng: random.Random) -> str:
+    paragraphs, length = [], 0
+    while length < size:
+        paragraph = " ".join(
+            f"See [{rng.choice(WORDS)} {i}](/api/{rng.randrange(10_000)}.html) or ![icon](/img/{i}.png)"
+            for i in range(rng.randint(4, 12))
+        )
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def emphasis_dense_corpus(size: int, rng: random.Random) -> str:
+    markup = ("**{}**", "_{}_", "`{}`", "{}")
+    paragraphs, length = [], 0
+    while length < size:
+        paragraph = " ".join(rng.choice(markup).format(rng.choice(WORDS)) for _ in range(rng.randint(20, 60)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def nested_corpus(size: int, rng: random.Random) -> str:
+    blocks, length = [], 0
+    while length < size:
+        items = "\n".join(f"- {rng.choice(WORDS)} **{rng.choice(WORDS)}**" for _ in range(rng.randint(3, 10)))
+        quote = "\n".join(f"> {rng.choice(WORDS)} _{rng.choice(WORDS)}_" for _ in range(rng.randint(1, 4)))
+        blocks.extend([f"## {rng.choice(WORDS)}", items, quote])
+        length += len(items) + len(quote) + 16
+    return "\n\n".join(blocks)
+
+
+def flat_corpus(size: int, rng: random.Random) -> str:
+    paragraphs, length = [], 0
+    while length < size:
+        paragraph = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet", "kilo", "lima")
+
+CORPORA: dict[str, Callable[[int, random.Random], str]] = {
+    "links":    link_dense_corpus,
+    "emphasis": emphasis_dense_corpus,
+    "nested":   nested_corpus,
+    "flat":     flat_corpus,
+}
+
+
+class StageResult(NamedTuple):
+    corpus:      str
+    stage:       str
+    bytes:       int
+    nodes:       int
+    seconds:     float
+    mb_per_s:    float
+    nodes_per_s: float
+    peak_kib:    float
+
+
+def corpus_stages(markdown: str, tree: ParentNode) -> dict[str, tuple[int, int, Callable[[], object]]]:
+    # Each stage gets its input prepared up front, so it is timed in isolation.
+    inline_texts = []
+    for block_type, lines in iter_blocks(markdown.splitlines()):
+        if block_type is BlockType.PARAGRAPH:
+            inline_texts.append(" ".join(lines))
+        elif block_type is not BlockType.CODE:
+            inline_texts.extend(line.split(" ", 1)[-1] for line in lines)
+    textnodes = [node for text in inline_texts for node in text_to_textnodes(text)]
+    inline_bytes = sum(len(text) for text in inline_texts)
+    html_bytes = len(tree.to_html())
+    return {
+        "inline":  (inline_bytes, len(textnodes), lambda: [text_to_textnodes(text) for text in inline_texts]),
+        "convert": (inline_bytes, len(textnodes), lambda: [text_node_to_html_node(node) for node in textnodes]),
+        "render":  (html_bytes, count_nodes(tree), tree.to_html),
+        "blocks":  (len(markdown), count_nodes(tree), lambda: markdown_to_html_node(markdown)),
+    }
+
+
+def run_suite(size: int, repeat: int, seed: int = 0) -> list[StageResult]:
+    results = []
+    for corpus_name, generate in CORPORA.items():
+        markdown = generate(size, random.Random(seed))
+        tree = markdown_to_html_node(markdown)
+        if corpus_name == "nested":
+            # Block markdown nests at most two levels, so the render stage also
+            # gets a generated deep tree.
+            tree = ParentNode("div", [tree, nested_tree(200, 4)])
+        for stage_name, (data_bytes, nodes, func) in corpus_stages(markdown, tree).items():
+            seconds = best_of(func, repeat)
+            results.append(StageResult(
+                corpus_name,
+                stage_name,
+                data_bytes,
+                nodes,
+                seconds,
+                data_bytes / seconds / 1e6,
+                nodes / seconds,
+                peak_memory(func) / 1024,
+            ))
+    return results
+
+
+def print_results(results: list[StageResult], baseline: dict[tuple[str, str], float] | None = None) -> None:
+    header = f"{'corpus':>9} {'stage':>8} {'seconds':>9} {'MB/s':>8} {'nodes/s':>11} {'peak KiB':>9}"
+    print(header + (f" {'vs base':>8}" if baseline else ""))
+    for result in results:
+        line = (
+            f"{result.corpus:>9} {result.stage:>8} {result.seconds:>9.4f} {result.mb_per_s:>8.2f}"
+            f" {result.nodes_per_s:>11.0f} {result.peak_kib:>9.0f}"
+        )
+        if baseline and (result.corpus, result.stage) in baseline:
+            line += f" {baseline[(result.corpus, result.stage)] / result.seconds:>7.2f}x"
+        print(line)
+
+
+def save_results(path: Path, results: list[StageResult], size: int, repeat: int) -> None:
+    data = {
+        "python":    platform.python_version(),
+        "platform":  platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "size":      size,
+        "repeat":    repeat,
+        "results":   [result._asdict() for result in results],
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[tuple[str, str], float]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {(result["corpus"], result["stage"]): result["seconds"] for result in data["results"]}
+
+
+def bench_spans() -> None:
+    print(f"{'corpus':>9} {'textnodes':>10} {'spans':>10} {'speedup':>8}")
+    for corpus_name in ("links", "emphasis", "flat"):
+        paragraphs = CORPORA[corpus_name](256 * 1024, random.Random(0)).split("\n\n")
+        nodes = best_of(lambda: [
+            "".join([text_node_to_html_node(node).to_html() for node in text_to_textnodes(paragraph)])
+            for paragraph in paragraphs
+        ])
+        spans = best_of(lambda: [spans_to_html(text_to_spans(paragraph)) for paragraph in paragraphs])
+        print(f"{corpus_name:>9} {nodes:>10.4f} {spans:>10.4f} {nodes / spans:>7.2f}x")
+
+
+def match_text_node_to_html(node: TextNode) -> str:
+    # The match statement and generic leaf rendering that the tag tables in
+    # textnode replaced, kept as the baseline for bench_dispatch.
+    match node.text_type:
+        case TextType.TEXT:
+            leaf = LeafNode(None, node.text)
+        case TextType.BOLD:
+            leaf = LeafNode("b", node.text)
+        case TextType.ITALIC:
+            leaf = LeafNode("i", node.text)
+        case TextType.CODE:
+            leaf = LeafNode("code", node.text)
+        case TextType.LINK:
+            leaf = LeafNode("a", node.text, {"href": node.url})
+        case _:
+            leaf = LeafNode("img", "", {"src": node.url, "alt": node.text})
+    if leaf.tag is None:
+        return leaf.value
+    return f"<{leaf.tag}{leaf.props_to_html()}>{leaf.value}</{leaf.tag}>"
+
+
+def bench_dispatch() -> None:
+    print(f"{'corpus':>9} {'nodes':>8} {'match':>10} {'table':>10} {'direct':>10} {'speedup':>8}")
+    for corpus_name in ("emphasis", "links"):
+        markdown = CORPORA[corpus_name](256 * 1024, random.Random(0))
+        nodes = [node for paragraph in markdown.split("\n\n") for node in text_to_textnodes(paragraph)]
+        match = best_of(lambda: [match_text_node_to_html(node) for node in nodes])
+        table = best_of(lambda: [text_node_to_html_node(node).to_html() for node in nodes])
+        direct = best_of(lambda: [text_node_to_html(node) for node in nodes])
+        print(f"{corpus_name:>9} {len(nodes):>8} {match:>10.4f} {table:>10.4f} {direct:>10.4f} {match / direct:>7.2f}x")
+
+
+def unescaped_to_html(root: ParentNode) -> str:
+    # ParentNode.iter_html as it was before leaf values and props were
+    # escaped, kept as the baseline for bench_escape.
+    stack = [(iter((root,)), "")]
+    chunk: list[str] = []
+    write = chunk.append
+    while stack:
+        children, closing_tag = stack[-1]
+        for node in children:
+            if node.__class__ is LeafNode:
+                tag, value = node.tag, node.value
+                if tag is None:
+                    write(value)
+                elif node.props:
+                    write(f"<{tag}{unescaped_props(node.props)}>{value}</{tag}>")
+                else:
+                    write(f"<{tag}>{value}</{tag}>")
+            else:
+                write(f"<{node.tag}{unescaped_props(node.props)}>")
+                stack.append((iter(node.children), f"</{node.tag}>"))
+                break
+        else:
+            stack.pop()
+            write(closing_tag)
+    return "".join(chunk)
+
+
+def unescaped_props(props: dict[str, str | None] | None) -> str:
+    return "".join([f' {key}="{value}"' for key, value in (props or {}).items()])
+
+
+def bench_escape() -> None:
+    print(f"{'corpus':>9} {'stage':>8} {'raw':>10} {'escaped':>10} {'overhead':>9}")
+    for corpus_name in CORPORA:
+        markdown = CORPORA[corpus_name](256 * 1024, random.Random(0))
+        tree = markdown_to_html_node(markdown)
+        lines = markdown.splitlines()
+        # Leaves remember their escaped value, so "render" is the cost of
+        # rendering a tree again, as watch mode and cached nodes do; the
+        # first render of a fresh tree is part of "page".
+        tree.to_html()
+        stages = {
+            "render": (lambda: unescaped_to_html(tree), tree.to_html),
+            "page":   (lambda: [unescaped_to_html(node) for node in iter_html_nodes(lines)], lambda: write_markdown_html(lines, io.StringIO())),
+        }
+        for stage, (unescaped, escaped) in stages.items():
+            # Alternating the two keeps drift on a busy machine from favouring
+            # either, and collections are paused so they land on neither.
+            raw_seconds, escaped_seconds = float("inf"), float("inf")
+            gc.disable()
+            try:
+                for _ in range(20):
+                    raw_seconds = min(raw_seconds, best_of(unescaped, 1))
+                    escaped_seconds = min(escaped_seconds, best_of(escaped, 1))
+            finally:
+                gc.enable()
+            print(f"{corpus_name:>9} {stage:>8} {raw_seconds:>10.4f} {escaped_seconds:>10.4f} {escaped_seconds / raw_seconds - 1:>8.1%}")
+
+
+def cached_page(markdown: str, nav: CachedNode) -> CachedNode:
+    return CachedNode("body", [nav] + [CachedNode(block.tag, block.children or [], block.props) for block in markdown_to_html_node(markdown).children or []])
+
+
+def bench_cached() -> None:
+    # Re-renders a page after editing one block, as watch mode would, against
+    # rendering the same page as plain ParentNodes from scratch.
+    print(f"{'corpus':>9} {'blocks':>7} {'full':>10} {'rerender':>10} {'speedup':>8}")
+    nav = CachedNode("nav", [LeafNode("a", f"page {i}", {"href": f"/page{i}"}) for i in range(50)])
+    for corpus_name in CORPORA:
+        markdown = CORPORA[corpus_name](256 * 1024, random.Random(0))
+        page = cached_page(markdown, nav)
+        plain = markdown_to_html_node(markdown)
+        plain.children = [ParentNode("nav", list(nav.children or ()))] + (plain.children or [])
+        blocks = list(page.children or ())[1:]
+        page.to_html()
+
+        def rerender() -> str:
+            blocks[len(blocks) // 2].props = {"class": "edited"}
+            return page.to_html()
+
+        full = best_of(plain.to_html)
+        cached = best_of(rerender)
+        print(f"{corpus_name:>9} {len(blocks):>7} {full:>10.4f} {cached:>10.4f} {full / cached:>7.2f}x")
+
+
+BENCHMARKS: dict[str, Callable[[], None]] = {
+    "links":    bench_link_scaling,
+    "nested":   bench_nested_render,
+    "memory":   bench_node_memory,
+    "spans":    bench_spans,
+    "dispatch": bench_dispatch,
+    "escape":   bench_escape,
+    "cached":   bench_cached,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the markdown to html pipeline.")
+    parser.add_argument("names",     nargs="*", help=f"benchmarks to run: suite (default), {', '.join(BENCHMARKS)}")
+    parser.add_argument("--size",    type=int,  default=512,  help="corpus size in KiB for the suite")
+    parser.add_argument("--repeat",  type=int,  default=5,    help="timed runs per stage, the best is reported")
+    parser.add_argument("--json",    type=Path, default=None, help="write suite results to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="show speedup against a saved results file")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name != "suite" and name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    for name in args.names or ["suite"]:
+        print(f"== {name}")
+        if name != "suite":
+            BENCHMARKS[name]()
+            continue
+        results = run_suite(args.size * 1024, args.repeat)
+        print_results(results, load_baseline(args.compare) if args.compare else None)
+        if args.json:
+            save_results(args.json, results, args.size * 1024, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from enum import Enum
+from typing import Iterable, Iterator, TextIO
+
+from escaping import needs_escaping
+from htmlnode import HTMLNode, LeafNode, ParentNode, _write_html
+from inline_cache import InlineCache
+from markdown import text_to_textnodes
+from textnode import TextType, text_node_to_html_node
+
+
+class BlockType(Enum):
+    PARAGRAPH      = "paragraph"
+    HEADING        = "heading"
+    CODE           = "code"
+    QUOTE          = "quote"
+    UNORDERED_LIST = "unordered_list"
+    ORDERED_LIST   = "ordered_list"
+
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[tuple[BlockType, list[str]]]:
+    # Only the lines of the block being read are held, so memory is bounded by
+    # the largest block rather than the whole document.
+    block: list[str] = []
+    in_code = False
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if in_code:
+            block.append(line)
+            if line.startswith("```"):
+                yield BlockType.CODE, block
+                block, in_code = [], False
+            continue
+
+        if line.startswith("```") and not block:
+            block, in_code = [line], True
+        elif line.strip() == "":
+            if block:
+                yield block_to_block_type(block), block
+                block = []
+        elif is_heading(line):
+            if block:
+                yield block_to_block_type(block), block
+                block = []
+            yield BlockType.HEADING, [line]
+        else:
+            block.append(line)
+
+    if in_code:
+        raise ValueError("invalid markdown, code block not closed")
+    if block:
+        yield block_to_block_type(block), block
+
+
+def is_heading(line: str) -> bool:
+    level = len(line) - len(line.lstrip("#"))
+    return 1 <= level <= 6 and line[level:level + 1] == " "
+
+
+def block_to_block_type(lines: list[str]) -> BlockType:
+    if len(lines) == 1 and is_heading(lines[0]):
+        return BlockType.HEADING
+    if len(lines) > 1 and lines[0].startswith("```") and lines[-1].startswith("```"):
+        return BlockType.CODE
+    if all(line.startswith(">") for line in lines):
+        return BlockType.QUOTE
+    if all(line.startswith("- ") for line in lines):
+        return BlockType.UNORDERED_LIST
+    if all(line.startswith(f"{i}. ") for i, line in enumerate(lines, 1)):
+        return BlockType.ORDERED_LIST
+    return BlockType.PARAGRAPH
+
+
+def block_to_html_node(
+    block_type: BlockType,
+    lines:      list[str],
+    targets:    list[str] | None = None,
+    cache:      InlineCache | None = None
+) -> ParentNode:
+    match block_type:
+        case BlockType.PARAGRAPH:
+            return ParentNode("p", text_to_children(" ".join(line.strip() for line in lines), targets, cache))
+        case BlockType.HEADING:
+            level = len(lines[0]) - len(lines[0].lstrip("#"))
+            return ParentNode(f"h{level}", text_to_children(lines[0][level + 1:].strip(), targets, cache))
+        case BlockType.CODE:
+            code = "".join(line + "\n" for line in lines[1:-1])
+            return ParentNode("pre", [LeafNode("code", code)])
+        case BlockType.QUOTE:
+            text = " ".join(line[1:].strip() for line in lines)
+            return ParentNode("blockquote", text_to_children(text, targets, cache))
+        case BlockType.UNORDERED_LIST:
+            return ParentNode("ul", [ParentNode("li", text_to_children(line[2:], targets, cache)) for line in lines])
+        case BlockType.ORDERED_LIST:
+            return ParentNode("ol", [ParentNode("li", text_to_children(line.split(". ", 1)[1], targets, cache)) for line in lines])
+        case _:
+            raise ValueError(f"invalid block type: {block_type}")
+
+
+def text_to_children(text: str, targets: list[str] | None = None, cache: InlineCache | None = None) -> list[HTMLNode]:
+    # Link and image urls are collected into targets from the parsed nodes,
+    # so indexing a page needs no second pass over its text. A cache skips
+    # parsing text seen before, such as navigation repeated on every page.
+    text_nodes = text_to_textnodes(text) if cache is None else cache.text_to_textnodes(text)
+    if targets is not None:
+        targets.extend([node.url for node in text_nodes if node.text_type is TextType.LINK or node.text_type is TextType.IMAGE])
+    return [text_node_to_html_node(node) for node in text_nodes]
+
+
+def iter_html_nodes(lines: Iterable[str], targets: list[str] | None = None, cache: InlineCache | None = None) -> Iterator[ParentNode]:
+    for block_type, block in iter_blocks(lines):
+        yield block_to_html_node(block_type, block, targets, cache)
+
+
+def markdown_to_html_node(markdown: str, targets: list[str] | None = None, cache: InlineCache | None = None) -> ParentNode:
+    return ParentNode("div", list(iter_html_nodes(markdown.splitlines(), targets, cache)))
+
+
+def write_markdown_html(
+    lines:   Iterable[str],
+    stream:  TextIO,
+    targets: list[str] | None = None,
+    cache:   InlineCache | None = None
+) -> None:
+    # Every value and url in a block's tree is a substring of the block's
+    # lines, so one scan of the block tells whether its leaves need escaping.
+    stream.write("<div>")
+    for block_type, block in iter_blocks(lines):
+        _write_html(block_to_html_node(block_type, block, targets, cache), stream, needs_escaping(block))
+    stream.write("</div>")
@@ -0,0 +1,206 @@
+import contextlib
+import os
+from pathlib import Path
+from typing import Iterator, NamedTuple, TextIO
+
+from block_markdown import write_markdown_html
+from escaping import escape_text
+from inline_cache import InlineCache
+from manifest import MANIFEST_NAME, Manifest, SourceRecord, snapshot, text_digest
+from page import render_page, title_from_lines
+from template import Template, load_template
+
+
+_worker_template: Template | None = None
+_worker_cache:    InlineCache | None = None
+
+
+class BuildResult(NamedTuple):
+    built:   list[Path]
+    skipped: int
+    removed: list[Path]
+    links:   dict[str, tuple[str, ...]]
+
+
+class PageError(ValueError):
+    # Names the page a conversion error came from; pickles with its args, so
+    # it reaches the parent unchanged from pool workers.
+    def __init__(self, page: str, message: str) -> None:
+        super().__init__(page, message)
+        self.page    = page
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.page}: {self.message}"
+
+
+def convert_page(markdown: str, template: Template, cache: InlineCache | None = None) -> tuple[str, tuple[str, ...]]:
+    targets: list[str] = []
+    html = render_page(markdown, template, targets, cache)
+    return html, unique_targets(targets)
+
+
+def generate_page(source: Path, destination: Path, template: Template, cache: InlineCache | None = None) -> tuple[str, ...]:
+    # The page is streamed block by block from source into the template's
+    # content slot; only the title is looked up first, normally the first line.
+    # Returns the link and image targets found while rendering.
+    targets: list[str] = []
+    try:
+        with source.open(encoding="utf-8") as markdown:
+            title = escape_text(title_from_lines(markdown))
+        with source.open(encoding="utf-8") as markdown, open_atomic(destination) as html:
+            template.write(html, {"Title": title, "Content": lambda stream: write_markdown_html(markdown, stream, targets, cache)})
+    except ValueError as error:
+        raise PageError(os.fspath(source), str(error)) from error
+    return unique_targets(targets)
+
+
+@contextlib.contextmanager
+def open_atomic(path: Path) -> Iterator[TextIO]:
+    # The page is written next to its destination and renamed over it only
+    # once complete, so a page that fails partway leaves the old one in place.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    try:
+        with open(temporary, "w", encoding="utf-8") as file:
+            yield file
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(path: Path, text: str) -> None:
+    with open_atomic(path) as file:
+        file.write(text)
+
+
+def unique_targets(targets: list[str]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(targets))
+
+
+def find_pages(content_dir: Path) -> list[str]:
+    names = []
+    for directory, _, files in os.walk(content_dir):
+        prefix = os.path.relpath(directory, content_dir).replace(os.sep, "/")
+        prefix = "" if prefix == "." else prefix + "/"
+        names.extend(prefix + file for file in files if file.endswith(".md"))
+    return sorted(names)
+
+
+def output_name(page: str) -> str:
+    return page[:-len(".md")] + ".html"
+
+
+class BuildPlan(NamedTuple):
+    template:        Template
+    template_digest: str
+    names:           list[str]
+    jobs:            list[tuple[Path, Path]]
+    records:         dict[str, SourceRecord]
+    removed:         list[Path]
+
+
+def build_site(
+    content_dir:   Path,
+    output_dir:    Path,
+    template_path: Path,
+    workers:       int | None = None,
+    force:         bool = False,
+    cache_size:    int | None = None
+) -> BuildResult:
+    # cache_size enables an inline cache of that many entries per worker,
+    # for sites that repeat the same fragments across many pages.
+    plan = plan_build(content_dir, output_dir, template_path, force)
+    links = run_jobs(plan.jobs, plan.template, workers, cache_size)
+    return finish_build(plan, output_dir, links)
+
+
+def plan_build(content_dir: Path, output_dir: Path, template_path: Path, force: bool = False) -> BuildPlan:
+    # Compares the content tree against the manifest, removes the outputs of
+    # deleted sources and returns the pages that still have to be generated.
+    template = load_template(template_path)
+    template_digest = text_digest(template.source)
+    # The manifest is loaded even when forced: force only skips the freshness
+    # check, and the recorded sources are still needed to remove stale pages.
+    manifest = Manifest.load(output_dir / MANIFEST_NAME)
+
+    # Paths are handled as relative name strings here because pathlib
+    # overhead dominates a no-op rebuild of a large content tree.
+    content_root, output_root = os.fspath(content_dir), os.fspath(output_dir)
+    records: dict[str, SourceRecord] = {}
+    names: list[str] = []
+    jobs: list[tuple[Path, Path]] = []
+    for name in find_pages(content_dir):
+        source, output = os.path.join(content_root, name), output_name(name)
+        record = None if force else manifest.is_fresh(name, source, output, template_digest)
+        if record is None or not os.path.exists(os.path.join(output_root, output)):
+            record = snapshot(source, output)
+            names.append(name)
+            jobs.append((content_dir / name, output_dir / output))
+        records[name] = record
+
+    removed = []
+    for name, record in manifest.sources.items():
+        if name not in records:
+            stale_output = output_dir / record.output
+            stale_output.unlink(missing_ok=True)
+            removed.append(stale_output)
+
+    return BuildPlan(template, template_digest, names, jobs, records, removed)
+
+
+def finish_build(plan: BuildPlan, output_dir: Path, links: list[tuple[str, ...]]) -> BuildResult:
+    # links holds the targets of each generated page in job order; unchanged
+    # pages keep the targets recorded when they were last generated.
+    for name, targets in zip(plan.names, links):
+        plan.records[name] = plan.records[name]._replace(links=targets)
+    Manifest(plan.template_digest, plan.records).save(output_dir / MANIFEST_NAME)
+    return BuildResult(
+        [destination for _, destination in plan.jobs],
+        len(plan.records) - len(plan.jobs),
+        plan.removed,
+        {name: record.links for name, record in plan.records.items()},
+    )
+
+
+def run_jobs(
+    jobs:       list[tuple[Path, Path]],
+    template:   Template,
+    workers:    int | None = None,
+    cache_size: int | None = None
+) -> list[tuple[str, ...]]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        cache = create_cache(cache_size)
+        return [generate_page(source, destination, template, cache) for source, destination in jobs]
+
+    # Workers compile the template once at startup and receive pages in
+    # batches, so per-page IPC is two paths in and the page's targets out.
+    # The pool machinery is imported here, as serial builds and single page
+    # renders never need it and it dominates the module's import time.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(template.source, cache_size)) as executor:
+        return list(executor.map(_generate_job, jobs, chunksize=chunksize))
+
+
+def create_cache(cache_size: int | None) -> InlineCache | None:
+    return InlineCache(cache_size) if cache_size else None
+
+
+def _init_worker(template_source: str, cache_size: int | None = None) -> None:
+    global _worker_template, _worker_cache
+    _worker_template = Template(template_source)
+    _worker_cache    = create_cache(cache_size)
+
+
+def _generate_job(job: tuple[Path, Path]) -> tuple[str, ...]:
+    assert _worker_template is not None
+    return generate_page(job[0], job[1], _worker_template, _worker_cache)
+
+
+def _convert_job(markdown: str) -> tuple[str, tuple[str, ...]]:
+    assert _worker_template is not None
+    return convert_page(markdown, _worker_template, _worker_cache)
@@ -0,0 +1,28 @@
+import functools
+from typing import Iterable
+
+
+ATTRIBUTE_CACHE_SIZE = 4096
+
+
+def escape_text(text: str) -> str:
+    # Most text has nothing to escape, and three substring checks on it are
+    # several times faster than a regex search or unconditional replaces.
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text
+
+
+@functools.lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def escape_attribute(value: str | None) -> str:
+    # Attribute values are mostly urls that repeat across a site, so escaped
+    # values are cached. None renders as before, as the string "None".
+    text = str(value)
+    if "&" in text or "<" in text or ">" in text or '"' in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return text
+
+
+def needs_escaping(lines: Iterable[str]) -> bool:
+    text = "\n".join(lines)
+    return "&" in text or "<" in text or ">" in text or '"' in text
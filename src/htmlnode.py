@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import weakref
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TextIO
+
+from escaping import escape_attribute, escape_text
+
+
+HTML_CHUNK_SIZE = 256
 
 class HTMLNode():
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(
         self,
         tag:                 str | None = None,
@@ -15,20 +25,28 @@ class HTMLNode():
         self.props    = props
 
     def to_html(self) -> str:
+        return "".join(self.iter_html())
+
+    def iter_html(self) -> Iterator[str]:
         raise NotImplementedError("Child class must override")
 
+    def write_html(self, stream: TextIO) -> None:
+        stream.writelines(self.iter_html())
+
     def props_to_html(self) -> str:
-        prop_str = ''
-        if self.props:
-            for key in self.props:
-                prop_str += f' {key}="{self.props[key]}"'
-        return prop_str
+        return _props_to_html(self.props, True)
 
     def __repr__(self) -> str:
         return f"HTMLNode({self.tag}, {self.value}, children: {self.children}, {self.props})"
 
 
 class LeafNode(HTMLNode):
+    # _escaped holds the value as last rendered, starting empty. Clean text
+    # escapes to the same object, so while value is unchanged a render checks
+    # identity instead of scanning the text again; any other value, including
+    # one assigned since, is escaped afresh.
+    __slots__ = ("_escaped",)
+
     def __init__(
         self,
         tag:   str | None,
@@ -36,21 +54,31 @@ class LeafNode(HTMLNode):
         props: dict[str, str | None] | None = None
     ) -> None:
         super().__init__(tag, value, None, props)
+        self._escaped = ""
 
     def to_html(self) -> str:
-        if self.value is None:
-            raise ValueError("All leaf nodes must have a value")
+        text = self._escaped
+        if text is not self.value:
+            text = _escape_leaf(self)
 
         if self.tag is None:
-            return self.value
+            return text
 
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+        if not self.props:
+            return f"<{self.tag}>{text}</{self.tag}>"
+
+        return f"<{self.tag}{self.props_to_html()}>{text}</{self.tag}>"
+
+    def iter_html(self) -> Iterator[str]:
+        yield self.to_html()
 
     def __repr__(self):
         return f"LeafNode({self.tag}, {self.value}, {self.props})"
 
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(
         self,
         tag:      str,
@@ -59,17 +87,230 @@ class ParentNode(HTMLNode):
     ) -> None:
         super().__init__(tag, None, children, props)
 
-    def to_html(self) -> str:
-        if self.tag is None:
-            raise ValueError("All parent nodes must have a tag")
+    def iter_html(self) -> Iterator[str]:
+        return _iter_html(self, True)
+
+    def __repr__(self):
+        return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+
+
+class CachedNode(ParentNode):
+    # A ParentNode that keeps its rendered html until it changes. Children are
+    # held as a tuple and props as a read-only mapping, so the only way to
+    # change the node is to assign tag, children or props, which clears the
+    # cached html of this node and of every cached node above it. Plain nodes
+    # below a CachedNode are treated as immutable; after changing one in place,
+    # call invalidate() on the nearest cached node above it.
+    __slots__ = ("_html", "_ancestors", "__weakref__")
+
+    def __init__(
+        self,
+        tag:      str,
+        children: list[HTMLNode],
+        props:    dict[str, str | None] | None = None
+    ) -> None:
+        self._html: str | None = None
+        self._ancestors: weakref.WeakSet[CachedNode | LazyNode] = weakref.WeakSet()
+        super().__init__(tag, children, props)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "children":
+            if value is not None:
+                value = tuple(value) # type: ignore[arg-type]
+            track_ancestor(getattr(self, "children", None), self, False)
+            track_ancestor(value, self, True)
+        elif name == "props" and value is not None:
+            value = MappingProxyType(dict(value)) # type: ignore[arg-type]
+        super().__setattr__(name, value)
+        if name in ("tag", "value", "children", "props"):
+            self.invalidate()
 
-        if self.children is None:
-            raise ValueError("All parent nodes must have children nodes")
+    def iter_html(self) -> Iterator[str]:
+        if self._html is None:
+            self._html = "".join(super().iter_html())
+        yield self._html
 
-        children_html = ''
-        for child in self.children:
-            children_html += child.to_html()
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
+    def invalidate(self) -> None:
+        invalidate_ancestors(self)
+
+    @property
+    def cached(self) -> bool:
+        return self._html is not None
 
     def __repr__(self):
-        return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+        return f"CachedNode({self.tag}, children: {self.children}, {self.props})"
+
+
+class LazyNode(HTMLNode):
+    # Stands in for a subtree that is built by calling build the first time
+    # it is rendered. reset() drops the built subtree so the next render
+    # builds it again, and clears the html cached above it.
+    __slots__ = ("build", "_node", "_ancestors", "__weakref__")
+
+    def __init__(self, build: Callable[[], HTMLNode]) -> None:
+        super().__init__()
+        self.build = build
+        self._node: HTMLNode | None = None
+        self._ancestors: weakref.WeakSet[CachedNode | LazyNode] = weakref.WeakSet()
+
+    @property
+    def node(self) -> HTMLNode:
+        if self._node is None:
+            self._node = self.build()
+            track_ancestor((self._node,), self, True)
+        return self._node
+
+    @property
+    def built(self) -> bool:
+        return self._node is not None
+
+    def iter_html(self) -> Iterator[str]:
+        return self.node.iter_html()
+
+    def reset(self) -> None:
+        if self._node is not None:
+            track_ancestor((self._node,), self, False)
+            self._node = None
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        invalidate_ancestors(self)
+
+    def __repr__(self):
+        return f"LazyNode({self.build}, built: {self.built})"
+
+
+def track_ancestor(children: Iterable[HTMLNode] | None, ancestor: CachedNode | LazyNode, add: bool) -> None:
+    # Registers ancestor with, or removes it from, the nearest cached and
+    # lazy nodes among children, looking through plain nodes in between.
+    stack = list(children or ())
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (CachedNode, LazyNode)):
+            if add:
+                node._ancestors.add(ancestor)
+            else:
+                node._ancestors.discard(ancestor)
+        elif node.children:
+            stack.extend(node.children)
+
+
+def invalidate_ancestors(node: CachedNode | LazyNode) -> None:
+    # Clears the cached html of node and of every cached node above it. A
+    # shared subtree, such as a navigation bar, may sit under many pages.
+    seen: set[int] = set()
+    stack: list[CachedNode | LazyNode] = [node]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, CachedNode):
+            node._html = None
+        stack.extend(node._ancestors)
+
+
+def _iter_html(root: ParentNode, escape: bool) -> Iterator[str]:
+    # Walks the tree with an explicit stack of child iterators instead of
+    # recursing, so nesting depth is not bounded by the recursion limit.
+    # Plain leaves are rendered inline and output is yielded in batches;
+    # any other node class, such as CachedNode, renders itself.
+    #
+    # escape=False skips the checks on plain nodes for a caller that has
+    # already checked their text, such as write_markdown_html. It is kept out
+    # of the public methods, and other node classes are always rendered
+    # escaped, so no cache is ever filled from an unchecked render.
+    if root.tag is None:
+        raise ValueError("All parent nodes must have a tag")
+
+    if root.children is None:
+        raise ValueError("All parent nodes must have children nodes")
+
+    chunk: list[str] = [f"<{root.tag}{_props_to_html(root.props, escape)}>"]
+    write = chunk.append
+    leaf_class, parent_class = LeafNode, ParentNode
+    stack: list[tuple[Iterator[HTMLNode], str]] = []
+    _push_children(stack, root.children, f"</{root.tag}>")
+    while stack:
+        children, closing_tag = stack[-1]
+        for node in children:
+            if node.__class__ is leaf_class:
+                tag = node.tag
+                if escape:
+                    value = node._escaped
+                    if value is not node.value:
+                        value = _escape_leaf(node)
+                else:
+                    value = node.value
+                    if value is None:
+                        raise ValueError("All leaf nodes must have a value")
+                if tag is None:
+                    write(value)
+                elif node.props:
+                    write(f"<{tag}{_props_to_html(node.props, escape)}>{value}</{tag}>")
+                else:
+                    write(f"<{tag}>{value}</{tag}>")
+            elif node.__class__ is parent_class:
+                if node.tag is None:
+                    raise ValueError("All parent nodes must have a tag")
+
+                if node.children is None:
+                    raise ValueError("All parent nodes must have children nodes")
+
+                write(f"<{node.tag}{_props_to_html(node.props, escape)}>")
+                if len(node.children) > HTML_CHUNK_SIZE:
+                    _push_children(stack, node.children, f"</{node.tag}>")
+                else:
+                    stack.append((iter(node.children), f"</{node.tag}>"))
+                break
+            else:
+                # Other node classes stream their own output, which is
+                # passed through rather than collected into this chunk.
+                if chunk:
+                    yield "".join(chunk)
+                    chunk.clear()
+                yield from node.iter_html()
+        else:
+            stack.pop()
+            write(closing_tag)
+            if len(chunk) >= HTML_CHUNK_SIZE:
+                yield "".join(chunk)
+                chunk.clear()
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def _escape_leaf(node: LeafNode) -> str:
+    if node.value is None:
+        raise ValueError("All leaf nodes must have a value")
+    node._escaped = escape_text(node.value)
+    return node._escaped
+
+
+def _write_html(root: ParentNode, stream: TextIO, escape: bool) -> None:
+    stream.writelines(_iter_html(root, escape))
+
+
+def _push_children(stack: list[tuple[Iterator[HTMLNode], str]], children: Sequence[HTMLNode], closing_tag: str) -> None:
+    # The children of a wide node are walked in windows of HTML_CHUNK_SIZE,
+    # each ending like a node of its own, so the chunk is checked between
+    # windows rather than after every leaf and is still bounded.
+    stack.append((iter(children[len(children) // HTML_CHUNK_SIZE * HTML_CHUNK_SIZE:]), closing_tag))
+    for start in reversed(range(0, len(children) - HTML_CHUNK_SIZE + 1, HTML_CHUNK_SIZE)):
+        stack.append((iter(children[start:start + HTML_CHUNK_SIZE]), ""))
+
+
+def _props_to_html(props: Mapping[str, str | None] | None, escape: bool) -> str:
+    # Nodes carry one or two props, for which appending to a string is
+    # cheaper than building a list to join.
+    html = ""
+    if not props:
+        return html
+    if not escape:
+        for key, value in props.items():
+            html = f'{html} {key}="{value}"'
+        return html
+    for key, value in props.items():
+        html = f'{html} {key}="{escape_attribute(value)}"'
+    return html
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, TypeVar
+
+from markdown import text_to_textnodes
+from textnode import TextNode, TextType, text_node_to_html
+
+
+T = TypeVar("T")
+
+
+class CacheStats(NamedTuple):
+    hits:    int
+    misses:  int
+    size:    int
+    maxsize: int
+
+
+class LRUCache(Generic[T]):
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError("cache size must be positive")
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._items: OrderedDict[str, T] = OrderedDict()
+
+    def get(self, key: str, compute: Callable[[str], T]) -> T:
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            value = self._items[key] = compute(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return value
+
+        self.hits += 1
+        self._items.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, len(self._items), self.maxsize)
+
+
+class InlineCache():
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._textnodes: LRUCache[tuple[tuple[str, TextType, str | None], ...]] = LRUCache(maxsize)
+        self._html:      LRUCache[str] = LRUCache(maxsize)
+
+    def text_to_textnodes(self, text: str) -> list[TextNode]:
+        # Cached entries are stored as plain tuples and rebuilt into fresh
+        # TextNodes, so callers may mutate the result without poisoning the cache.
+        spans = self._textnodes.get(text, _parse_spans)
+        return [TextNode(text, text_type, url) for text, text_type, url in spans]
+
+    def text_to_html(self, text: str) -> str:
+        return self._html.get(text, _render_inline)
+
+    def clear(self) -> None:
+        self._textnodes.clear()
+        self._html.clear()
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {"textnodes": self._textnodes.stats(), "html": self._html.stats()}
+
+
+def _parse_spans(text: str) -> tuple[tuple[str, TextType, str | None], ...]:
+    return tuple((node.text, node.text_type, node.url) for node in text_to_textnodes(text))
+
+
+def _render_inline(text: str) -> str:
+    return "".join([text_node_to_html(node) for node in text_to_textnodes(text)])
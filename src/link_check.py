@@ -0,0 +1,118 @@
+import os
+import posixpath
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from build import output_name
+from manifest import MANIFEST_NAME
+
+
+# Targets with a scheme such as https: or mailto:, protocol-relative urls
+# and anchors within the same page are not checked.
+EXTERNAL_PREFIXES = ("//", "#")
+
+UNRESOLVED: Any = object()
+
+
+class LinkReport(NamedTuple):
+    broken:  list[tuple[str, str]]
+    orphans: list[str]
+
+    def summary(self) -> str:
+        lines = [f"broken link in {page}: {target}" for page, target in self.broken]
+        lines.extend(f"orphan page: {page}" for page in self.orphans)
+        lines.append(f"{len(self.broken)} broken links, {len(self.orphans)} orphan pages")
+        return "\n".join(lines)
+
+
+def check_links(links: Mapping[str, Sequence[str]], output_dir: Path | None = None) -> LinkReport:
+    # links maps each page's content name to its link and image targets.
+    # Internal targets must resolve to a generated page or to a file already
+    # in the output directory, such as an image or stylesheet.
+    outputs = {output_name(page): page for page in links}
+    files = set(outputs)
+    if output_dir is not None:
+        files.update(name for name in find_files(output_dir) if is_static_file(name))
+
+    # Pages share most of their targets, such as navigation links. Absolute
+    # and external targets resolve the same from every page and are cached
+    # once; relative ones are cached per directory they are linked from.
+    broken: list[tuple[str, str]] = []
+    linked: set[str | None] = set()
+    absolute: dict[str, str | None] = {}
+    relative: dict[str, dict[str, str | None]] = {}
+    for page, targets in links.items():
+        try:
+            paths = [absolute[target] for target in targets]
+        except KeyError:
+            base = page.rpartition("/")[0]
+            cache = relative.setdefault(base, {})
+            paths = []
+            for target in targets:
+                path = absolute.get(target, UNRESOLVED)
+                if path is UNRESOLVED:
+                    path = cache.get(target, UNRESOLVED)
+                if path is UNRESOLVED:
+                    path = resolve_file(files, base, target)
+                    if target.startswith("/") or path is None:
+                        absolute[target] = path
+                    else:
+                        cache[target] = path
+                paths.append(path)
+        if "" in paths:
+            broken.extend((page, target) for target, path in zip(targets, paths) if path == "")
+        output = output_name(page)
+        if output in paths:
+            # A page linking to itself does not keep it from being an orphan.
+            linked.update([path for path in paths if path != output])
+        else:
+            linked.update(paths)
+
+    orphans = [page for output, page in sorted(outputs.items()) if output not in linked and output != "index.html"]
+    return LinkReport(broken, orphans)
+
+
+def is_static_file(name: str) -> bool:
+    # Pages are only valid targets while their source exists, so html left
+    # behind in the output directory does not count, nor do build artifacts
+    # such as the manifest and interrupted atomic writes.
+    return not name.endswith((".html", ".tmp")) and name.rpartition("/")[2] != MANIFEST_NAME
+
+
+def resolve_file(files: set[str], base: str, target: str) -> str | None:
+    # Returns the file a target points to, "" when there is no such file or
+    # None when the target is not checked.
+    path = resolve_target(base, target)
+    if path is None:
+        return None
+    if path in files:
+        return path
+    index = posixpath.join(path, "index.html")
+    return index if index in files else ""
+
+
+def resolve_target(base: str, target: str) -> str | None:
+    # Returns the target as a path relative to the site root, or None when it
+    # is external or points back into the current page.
+    if target.startswith(EXTERNAL_PREFIXES) or ":" in target.partition("/")[0]:
+        return None
+    path = target.partition("#")[0].partition("?")[0]
+    if not path:
+        return None
+    if path.startswith("/"):
+        if "/." not in path and "//" not in path:
+            return path.strip("/")
+    else:
+        path = posixpath.join(base, path)
+    path = posixpath.normpath(path).lstrip("/")
+    return "" if path == "." else path
+
+
+def find_files(output_dir: Path) -> set[str]:
+    files = set()
+    root = os.fspath(output_dir)
+    for directory, _, names in os.walk(root):
+        prefix = os.path.relpath(directory, root).replace(os.sep, "/")
+        prefix = "" if prefix == "." else prefix + "/"
+        files.update(prefix + name for name in names)
+    return files
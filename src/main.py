@@ -1,10 +1,105 @@
-from htmlnode import HTMLNode
+import argparse
+import sys
+from typing import TextIO
 
 
-def main() -> None:
-    dummy2 = HTMLNode("a", "this is a link.", None, {"href": "https://boot.dev", "target": "_blank"})
-    dummy3 = HTMLNode("p", "this is a paragraph.", [dummy2], None)
-    print(dummy3)
+# Modules, pathlib included, are imported by the mode that needs them rather
+# than at the top, so rendering one page to stdout does not pay for process
+# pools, asyncio or the watcher. Run as `python3 src` or `python3 src/main.py`.
 
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["render"]:
+        render_main(argv[1:])
+    else:
+        build_main(argv[1:] if argv[:1] == ["build"] else argv)
 
-main()
+
+def build_main(argv: list[str]) -> None:
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(
+        prog="ssg [build]",
+        description="Build the static site from markdown content.",
+        epilog="Use `ssg render PAGE` to render a single page to stdout.",
+    )
+    parser.add_argument("--content",  type=Path, default=Path("content"),       help="directory of markdown pages")
+    parser.add_argument("--output",   type=Path, default=Path("public"),        help="directory for generated html")
+    parser.add_argument("--template", type=Path, default=Path("template.html"), help="page template")
+    parser.add_argument("--workers",  type=int,  default=None,                  help="worker processes (default: cpu count)")
+    parser.add_argument("--force",    action="store_true",                      help="rebuild every page, ignoring the build manifest")
+    parser.add_argument("--watch",    action="store_true",                      help="keep running and rebuild pages as they change")
+    parser.add_argument("--async-io", action="store_true",                      help="read and write pages concurrently with asyncio")
+    parser.add_argument("--inline-cache", type=int, default=None, metavar="SIZE", help="cache parsed inline text, up to SIZE entries per worker")
+    parser.add_argument("--profile",  action="store_true",                      help="time each conversion stage and print a summary")
+    parser.add_argument("--profile-json", type=Path, default=None,              help="also write per-page stage timings to this file")
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        from watch import watch_site
+        watch_site(args.content, args.output, args.template, args.workers, args.inline_cache)
+        return
+
+    # A page that fails to convert stops the build; it is named on stderr
+    # rather than with a traceback.
+    try:
+        if args.profile or args.profile_json:
+            from build import build_site
+            from profiling import Profiler, write_report
+            # Hooks are patched into this process only, so profiled builds run serially.
+            with Profiler() as profiler:
+                result = build_site(args.content, args.output, args.template, 1, args.force, args.inline_cache)
+            write_report(profiler, args.profile_json)
+        elif args.async_io:
+            from async_build import build_site_async
+            result = build_site_async(args.content, args.output, args.template, args.workers, args.force, cache_size=args.inline_cache)
+        else:
+            from build import build_site
+            result = build_site(args.content, args.output, args.template, args.workers, args.force, args.inline_cache)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        sys.exit(1)
+    print(f"built {len(result.built)} pages, {result.skipped} unchanged, {len(result.removed)} removed in {args.output}")
+
+    from link_check import check_links
+    report = check_links(result.links, args.output)
+    if report.broken or report.orphans:
+        print(report.summary())
+
+
+def render_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ssg render",
+        description="Render one markdown page to html, for previews and editor integrations.",
+    )
+    parser.add_argument("page",             nargs="?", default="-",  help="markdown file, or - to read stdin (default)")
+    parser.add_argument("--template", "-t", default=None,            help="render a full page with this template instead of only its content")
+    parser.add_argument("--output",   "-o", default=None,            help="write to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.page == "-":
+        markdown = sys.stdin.read()
+    else:
+        with open(args.page, encoding="utf-8") as file:
+            markdown = file.read()
+
+    if args.output is None:
+        render_page_to(markdown, args.template, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            render_page_to(markdown, args.template, stream)
+
+
+def render_page_to(markdown: str, template_path: str | None, stream: TextIO) -> None:
+    if template_path is None:
+        from block_markdown import write_markdown_html
+        write_markdown_html(markdown.splitlines(), stream)
+        return
+
+    from page import render_page
+    from template import load_template
+    stream.write(render_page(markdown, load_template(template_path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+MANIFEST_NAME    = ".ssg-manifest.json"
+MANIFEST_VERSION = 2
+
+
+class SourceRecord(NamedTuple):
+    mtime_ns: int
+    size:     int
+    digest:   str
+    output:   str
+    links:    tuple[str, ...] = ()
+
+
+class Manifest():
+    def __init__(
+        self,
+        template_digest: str = "",
+        sources:         dict[str, SourceRecord] | None = None
+    ) -> None:
+        self.template_digest = template_digest
+        self.sources         = sources if sources is not None else {}
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION:
+                return cls()
+            sources = {name: SourceRecord(*record[:4], tuple(record[4])) for name, record in data["sources"].items()}
+            return cls(data["template"], sources)
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+    def save(self, path: Path) -> None:
+        data = {
+            "version":  MANIFEST_VERSION,
+            "template": self.template_digest,
+            "sources":  {name: list(record) for name, record in sorted(self.sources.items())},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(temporary, path)
+
+    def is_fresh(self, name: str, source: str | Path, output: str, template_digest: str) -> SourceRecord | None:
+        # Returns the record to keep when the source needs no rebuild, or None.
+        # Matching mtime and size are trusted without reading the file; a touched
+        # file with unchanged size is confirmed by its content digest.
+        record = self.sources.get(name)
+        if record is None or record.output != output or template_digest != self.template_digest:
+            return None
+
+        stat = os.stat(source)
+        if record.size != stat.st_size:
+            return None
+        if record.mtime_ns == stat.st_mtime_ns:
+            return record
+        if record.digest == file_digest(source):
+            return record._replace(mtime_ns=stat.st_mtime_ns)
+        return None
+
+
+def snapshot(source: str | Path, output: str) -> SourceRecord:
+    stat = os.stat(source)
+    return SourceRecord(stat.st_mtime_ns, stat.st_size, file_digest(source), output)
+
+
+def file_digest(path: str | Path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -1,7 +1,40 @@
-from re import findall
+import functools
+import re
+from typing import Protocol
+
 from textnode import TextType, TextNode
 
 
+IMAGE_PATTERN = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+LINK_PATTERN  = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
+IMAGE_OR_LINK_PATTERN = f"{IMAGE_PATTERN}|{LINK_PATTERN}"
+INLINE_DELIMITERS = (("**", TextType.BOLD), ("_", TextType.ITALIC), ("`", TextType.CODE))
+
+# Scanned spans carry the index of their TextType in TEXT_TYPES, so they can
+# be stored in integer arrays as well as turned into TextNodes.
+TEXT_TYPES      = tuple(TextType)
+TEXT_TYPE_CODES = {text_type: code for code, text_type in enumerate(TEXT_TYPES)}
+TEXT_CODE       = TEXT_TYPE_CODES[TextType.TEXT]
+LINK_CODE       = TEXT_TYPE_CODES[TextType.LINK]
+IMAGE_CODE      = TEXT_TYPE_CODES[TextType.IMAGE]
+INLINE_DELIMITER_CODES = tuple((delimiter, TEXT_TYPE_CODES[text_type]) for delimiter, text_type in INLINE_DELIMITERS)
+
+InlineSpan = tuple[int, int, int, int, int]
+
+
+# Anything the scanner can append spans to, such as a list or a SpanArray.
+class SpanSink(Protocol):
+    def append(self, span: InlineSpan, /) -> object: ...
+    def __len__(self) -> int: ...
+
+
+# Patterns are compiled on first use instead of at import, which a one page
+# render from the command line would otherwise pay for before doing any work.
+@functools.cache
+def compiled(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
 def split_nodes_delimiter(
     old_nodes: list[TextNode],
     delimiter: str,
@@ -32,72 +65,101 @@ def split_nodes_delimiter(
     return new_nodes
 
 def split_nodes_image(old_nodes: list[TextNode]) -> list[TextNode]:
-    new_nodes = []
-    for old_node in old_nodes:
-        if old_node.text_type is not TextType.TEXT:
-            new_nodes.append(old_node)
-            continue
-
-        full_node_text = old_node.text
-        images = extract_markdown_images(full_node_text)
-        if len(images) == 0:
-            new_nodes.append(old_node)
-            continue
-
-        for image in images:
-            sections = full_node_text.split(f"![{image[0]}]({image[1]})", 1)
-            if len(sections) != 2:
-                raise ValueError("invalid markdown, image section not closed")
-            if sections[0] != "":
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
-            new_nodes.append(TextNode(image[0], TextType.IMAGE, image[1]))
-            full_node_text = sections[1]
-
-        if full_node_text != "":
-            new_nodes.append(TextNode(full_node_text, TextType.TEXT))
-
-    return new_nodes
+    return _split_nodes_pattern(old_nodes, compiled(IMAGE_PATTERN), TextType.IMAGE)
 
 def split_nodes_link(old_nodes: list[TextNode]) -> list[TextNode]:
+    return _split_nodes_pattern(old_nodes, compiled(LINK_PATTERN), TextType.LINK)
+
+def _split_nodes_pattern(
+    old_nodes: list[TextNode],
+    pattern:   re.Pattern[str],
+    text_type: TextType
+) -> list[TextNode]:
     new_nodes = []
     for old_node in old_nodes:
         if old_node.text_type is not TextType.TEXT:
             new_nodes.append(old_node)
             continue
 
-        full_node_text = old_node.text
-        links = extract_markdown_links(full_node_text)
-        if len(links) == 0:
-            new_nodes.append(old_node)
-            continue
-
-        for link in links:
-            sections = full_node_text.split(f"[{link[0]}]({link[1]})", 1)
-            if len(sections) != 2:
-                raise ValueError("invalid markdown, link section not closed")
-            if sections[0] != "":
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
-            new_nodes.append(TextNode(link[0], TextType.LINK, link[1]))
-            full_node_text = sections[1]
+        text = old_node.text
+        position = 0
+        for match in pattern.finditer(text):
+            if match.start() > position:
+                new_nodes.append(TextNode(text[position:match.start()], TextType.TEXT))
+            new_nodes.append(TextNode(match.group(1), text_type, match.group(2)))
+            position = match.end()
 
-        if full_node_text != "":
-            new_nodes.append(TextNode(full_node_text, TextType.TEXT))
+        if position == 0:
+            new_nodes.append(old_node)
+        elif position < len(text):
+            new_nodes.append(TextNode(text[position:], TextType.TEXT))
 
     return new_nodes
 
 def extract_markdown_images(text: str) -> list[tuple[str, ...]]:
-    image_pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    matches = findall(image_pattern, text)
-    return matches
+    return compiled(IMAGE_PATTERN).findall(text)
 
 def extract_markdown_links(text: str) -> list[tuple[str, ...]]:
-    link_pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    matches = findall(link_pattern, text)
-    return matches
+    return compiled(LINK_PATTERN).findall(text)
 
 def text_to_textnodes(text: str) -> list[TextNode]:
-    nodes = [ TextNode(text, TextType.TEXT)]
-    text_type_delimiter = {"**": TextType.BOLD, "_": TextType.ITALIC, "`": TextType.CODE}
-    for delimiter in text_type_delimiter:
-        nodes = split_nodes_delimiter(nodes, delimiter, text_type_delimiter[delimiter])
-    return split_nodes_link(split_nodes_image(nodes))
+    return [
+        TextNode(text[start:end], TEXT_TYPES[code], text[url_start:url_end] if url_start >= 0 else None)
+        for start, end, code, url_start, url_end in scan_inline(text)
+    ]
+
+def scan_inline(text: str) -> list[InlineSpan]:
+    # Spans are offsets into text and a type code; url_start and url_end are
+    # -1 for spans without a url. Callers decide when, or whether, to copy
+    # substrings.
+    spans: list[InlineSpan] = []
+    scan_inline_into(text, spans)
+    return spans
+
+def scan_inline_into(text: str, spans: SpanSink) -> None:
+    # Appends each span to spans as it is found, so a caller can store them
+    # without a list of tuples in between, e.g. in an array of integers.
+    _scan_delimited(text, 0, len(text), 0, spans)
+
+def _scan_delimited(text: str, start: int, end: int, level: int, spans: SpanSink) -> None:
+    # Delimiters bind in the order of INLINE_DELIMITERS, so the text between two
+    # matched delimiters of one level is only scanned for the levels after it.
+    if level == len(INLINE_DELIMITER_CODES):
+        _scan_images_and_links(text, start, end, spans)
+        return
+
+    delimiter, code = INLINE_DELIMITER_CODES[level]
+    width = len(delimiter)
+    position = start
+    while True:
+        opening = text.find(delimiter, position, end)
+        if opening == -1:
+            break
+        closing = text.find(delimiter, opening + width, end)
+        if closing == -1:
+            raise ValueError("invalid markdown, formatted section not closed")
+
+        _scan_delimited(text, position, opening, level + 1, spans)
+        if closing > opening + width:
+            spans.append((opening + width, closing, code, -1, -1))
+        position = closing + width
+
+    _scan_delimited(text, position, end, level + 1, spans)
+
+def _scan_images_and_links(text: str, start: int, end: int, spans: SpanSink) -> None:
+    if start == end:
+        return
+
+    position = start
+    if text.find("[", start, end) != -1:
+        for match in compiled(IMAGE_OR_LINK_PATTERN).finditer(text, start, end):
+            if match.start() > position:
+                spans.append((position, match.start(), TEXT_CODE, -1, -1))
+            if match.start(2) != -1:
+                spans.append((match.start(1), match.end(1), IMAGE_CODE, match.start(2), match.end(2)))
+            else:
+                spans.append((match.start(3), match.end(3), LINK_CODE, match.start(4), match.end(4)))
+            position = match.end()
+
+    if position < end:
+        spans.append((position, end, TEXT_CODE, -1, -1))
@@ -0,0 +1,26 @@
+from typing import Iterable
+
+from block_markdown import write_markdown_html
+from escaping import escape_text
+from inline_cache import InlineCache
+from template import Template
+
+
+# Kept apart from build so rendering a single page with a template does not
+# load the manifest, hashing or process pool machinery.
+
+def extract_title(markdown: str) -> str:
+    return title_from_lines(markdown.splitlines())
+
+
+def title_from_lines(lines: Iterable[str]) -> str:
+    for line in lines:
+        if line.startswith("# "):
+            return line[2:].strip()
+    raise ValueError("invalid markdown, page has no h1 title")
+
+
+def render_page(markdown: str, template: Template, targets: list[str] | None = None, cache: InlineCache | None = None) -> str:
+    lines = markdown.splitlines()
+    title = escape_text(title_from_lines(lines))
+    return template.render({"Title": title, "Content": lambda stream: write_markdown_html(lines, stream, targets, cache)})
@@ -0,0 +1,175 @@
+import functools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+
+class Hook(NamedTuple):
+    stage:     str
+    module:    str
+    owner:     str | None
+    name:      str
+    nodes_arg: int | None = None
+    count:     Callable[[Any], int] | None = None
+
+
+# Each hook wraps one function or method. Stages that append to a node list
+# passed as an argument count the nodes they added; others count their result.
+HOOKS = (
+    Hook("delimiters",   "markdown",       None,       "_scan_delimited",        nodes_arg=4),
+    Hook("images_links", "markdown",       None,       "_scan_images_and_links", nodes_arg=3),
+    Hook("delimiters",   "markdown",       None,       "split_nodes_delimiter",  count=len),
+    Hook("images_links", "markdown",       None,       "split_nodes_image",      count=len),
+    Hook("images_links", "markdown",       None,       "split_nodes_link",       count=len),
+    Hook("to_html_node", "textnode",       None,       "text_node_to_html_node", count=lambda _: 1),
+    Hook("blocks",       "block_markdown", None,       "block_to_html_node",     count=lambda _: 1),
+    Hook("to_html",      "htmlnode",       "HTMLNode", "to_html"),
+    Hook("to_html",      "htmlnode",       "HTMLNode", "write_html"),
+    Hook("to_html",      "htmlnode",       None,       "_write_html"),
+    Hook("to_html",      "htmlnode",       "LeafNode", "to_html"),
+    Hook("page",         "build",          None,       "generate_page"),
+)
+
+TOTAL = "*"
+
+
+class StageStats():
+    __slots__ = ("calls", "seconds", "nodes")
+
+    def __init__(self) -> None:
+        self.calls   = 0
+        self.seconds = 0.0
+        self.nodes   = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {"calls": self.calls, "seconds": self.seconds, "nodes": self.nodes}
+
+
+class Profiler():
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str], StageStats] = {}
+        self._page = TOTAL
+        self._frames: list[list[float]] = []
+        self._patches: list[tuple[object, str, Callable[..., Any]]] = []
+
+    def enable(self) -> None:
+        # Hooks are patched in only while enabled, so a disabled profiler
+        # leaves the original functions in place and costs nothing.
+        if self._patches:
+            return
+        for hook in HOOKS:
+            module = __import__(hook.module)
+            if hook.owner is not None:
+                owner = getattr(module, hook.owner)
+                original = owner.__dict__[hook.name]
+                self._patch(owner, hook.name, original, self._wrap(hook, original))
+                continue
+
+            original = getattr(module, hook.name)
+            wrapper = self._wrap(hook, original)
+            for loaded in list(sys.modules.values()):
+                if getattr(loaded, "__dict__", {}).get(hook.name) is original:
+                    self._patch(loaded, hook.name, original, wrapper)
+
+    def disable(self) -> None:
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.disable()
+
+    def totals(self) -> dict[str, StageStats]:
+        totals: dict[str, StageStats] = {}
+        for (_, stage), stats in self.stats.items():
+            total = totals.setdefault(stage, StageStats())
+            total.calls   += stats.calls
+            total.seconds += stats.seconds
+            total.nodes   += stats.nodes
+        return totals
+
+    def slowest_pages(self, limit: int = 10) -> list[tuple[str, float]]:
+        pages: dict[str, float] = {}
+        for (page, _), stats in self.stats.items():
+            if page != TOTAL:
+                pages[page] = pages.get(page, 0.0) + stats.seconds
+        return sorted(pages.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [f"{'stage':<14} {'calls':>9} {'seconds':>9} {'nodes':>10}"]
+        for stage, stats in sorted(self.totals().items(), key=lambda item: item[1].seconds, reverse=True):
+            lines.append(f"{stage:<14} {stats.calls:>9} {stats.seconds:>9.4f} {stats.nodes:>10}")
+        slowest = self.slowest_pages(limit)
+        if slowest:
+            lines.append("")
+            lines.append(f"{'slowest pages':<50} {'seconds':>9}")
+            lines.extend(f"{page:<50} {seconds:>9.4f}" for page, seconds in slowest)
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        pages: dict[str, dict[str, dict[str, float]]] = {}
+        for (page, stage), stats in sorted(self.stats.items()):
+            pages.setdefault(page, {})[stage] = stats.as_dict()
+        totals = {stage: stats.as_dict() for stage, stats in self.totals().items()}
+        return json.dumps({"totals": totals, "pages": pages}, indent=2)
+
+    def _patch(self, owner: object, name: str, original: Callable[..., Any], wrapper: Callable[..., Any]) -> None:
+        setattr(owner, name, wrapper)
+        self._patches.append((owner, name, original))
+
+    def _wrap(self, hook: Hook, original: Callable[..., Any]) -> Callable[..., Any]:
+        frames = self._frames
+
+        @functools.wraps(original)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if hook.stage == "page":
+                previous, self._page = self._page, os.fspath(args[0])
+            nodes = args[hook.nodes_arg] if hook.nodes_arg is not None else None
+            before = len(nodes) if nodes is not None else 0
+
+            # Each frame collects the time and nodes of nested hooked calls, so
+            # a stage is charged only for its own work.
+            frame = [0.0, 0]
+            frames.append(frame)
+            start = time.perf_counter()
+            try:
+                result = original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                frames.pop()
+                if hook.stage == "page":
+                    self._page = previous
+
+            if nodes is not None:
+                produced = len(nodes) - before
+            elif hook.count is not None:
+                produced = hook.count(result)
+            else:
+                produced = 0
+            if frames:
+                frames[-1][0] += elapsed
+                frames[-1][1] += produced
+
+            page = os.fspath(args[0]) if hook.stage == "page" else self._page
+            stats = self.stats.get((page, hook.stage))
+            if stats is None:
+                stats = self.stats[(page, hook.stage)] = StageStats()
+            stats.calls   += 1
+            stats.seconds += elapsed - frame[0]
+            stats.nodes   += produced - int(frame[1]) if nodes is not None else produced
+            return result
+
+        return wrapper
+
+
+def write_report(profiler: Profiler, path: Path | None = None) -> None:
+    print(profiler.summary())
+    if path is not None:
+        path.write_text(profiler.to_json(), encoding="utf-8")
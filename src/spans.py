@@ -0,0 +1,107 @@
+from array import array
+from typing import Iterator
+
+from escaping import escape_attribute, escape_text
+from markdown import IMAGE_CODE, LINK_CODE, TEXT_CODE, TEXT_TYPE_CODES, TEXT_TYPES, scan_inline_into
+from textnode import TAG_CLOSE, TAG_OPEN, TextNode
+
+
+SPAN_FIELDS = 5
+
+CODE_TAG_OPEN  = {TEXT_TYPE_CODES[text_type]: tag for text_type, tag in TAG_OPEN.items()}
+CODE_TAG_CLOSE = {TEXT_TYPE_CODES[text_type]: tag for text_type, tag in TAG_CLOSE.items()}
+
+
+class SpanArray(array):
+    # Spans stored as SPAN_FIELDS integers apiece. append is array.extend, so
+    # the scanner appends each span straight into the array and no object is
+    # kept per span; len counts spans, not integers.
+    append = array.extend
+
+    def __len__(self) -> int:
+        return array.__len__(self) // SPAN_FIELDS
+
+
+class TextSpans():
+    # Each span is the offsets of its text in the source, its TextType code
+    # and the offsets of its url, which are -1 for spans without a url.
+    # starts, ends and the other field properties are memoryviews striding
+    # over data, so they copy nothing; data cannot grow while one is held.
+    __slots__ = ("text", "data")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.data = SpanArray("l")
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[TextNode]:
+        text, fields = self.text, iter(self.data)
+        for start, end, code, url_start, url_end in zip(fields, fields, fields, fields, fields):
+            yield TextNode(text[start:end], TEXT_TYPES[code], text[url_start:url_end] if url_start >= 0 else None)
+
+    @property
+    def starts(self) -> memoryview:
+        return memoryview(self.data)[0::SPAN_FIELDS]
+
+    @property
+    def ends(self) -> memoryview:
+        return memoryview(self.data)[1::SPAN_FIELDS]
+
+    @property
+    def types(self) -> memoryview:
+        return memoryview(self.data)[2::SPAN_FIELDS]
+
+    @property
+    def url_starts(self) -> memoryview:
+        return memoryview(self.data)[3::SPAN_FIELDS]
+
+    @property
+    def url_ends(self) -> memoryview:
+        return memoryview(self.data)[4::SPAN_FIELDS]
+
+    def to_textnodes(self) -> list[TextNode]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"TextSpans({len(self)} spans over {len(self.text)} chars)"
+
+
+def text_to_spans(text: str) -> TextSpans:
+    spans = TextSpans(text)
+    scan_inline_into(text, spans.data)
+    return spans
+
+
+def spans_to_html(spans: TextSpans) -> str:
+    # Renders the same html as text_node_to_html_node(...).to_html() for each
+    # span, slicing the source text only here and building no LeafNodes.
+    # Every span is a substring of the source, so one scan of it decides
+    # whether the spans need escaping at all.
+    text = spans.text
+    escape = "&" in text or "<" in text or ">" in text or '"' in text
+    parts: list[str] = []
+    append = parts.append
+    fields = iter(spans.data)
+    for start, end, code, url_start, url_end in zip(fields, fields, fields, fields, fields):
+        value = text[start:end]
+        if code == TEXT_CODE:
+            append(escape_text(value) if escape else value)
+        elif code == LINK_CODE:
+            url = text[url_start:url_end]
+            if escape:
+                url, value = escape_attribute(url), escape_text(value)
+            append(f'<a href="{url}">{value}</a>')
+        elif code == IMAGE_CODE:
+            url = text[url_start:url_end]
+            if escape:
+                url, value = escape_attribute(url), escape_attribute(value)
+            append(f'<img src="{url}" alt="{value}"></img>')
+        else:
+            append(f"{CODE_TAG_OPEN[code]}{escape_text(value) if escape else value}{CODE_TAG_CLOSE[code]}")
+    return "".join(parts)
+
+
+def text_to_html(text: str) -> str:
+    return spans_to_html(text_to_spans(text))
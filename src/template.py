@@ -0,0 +1,66 @@
+import io
+import os
+import re
+from pathlib import Path
+from typing import Callable, Mapping, TextIO
+
+
+SLOT_PATTERN = r"\{\{\s*(\w+)\s*\}\}"
+
+SlotValue = str | Callable[[TextIO], None]
+
+
+class Template():
+    def __init__(self, source: str) -> None:
+        # The template is split once into static chunks around its slots:
+        # chunks[i] is followed by slots[i], and chunks has one extra tail chunk.
+        self.source = source
+        self.chunks: list[str] = []
+        self.slots:  list[str] = []
+        position = 0
+        for match in re.finditer(SLOT_PATTERN, source):
+            self.chunks.append(source[position:match.start()])
+            self.slots.append(match.group(1))
+            position = match.end()
+        self.chunks.append(source[position:])
+
+    def render(self, values: Mapping[str, SlotValue]) -> str:
+        buffer = io.StringIO()
+        self.write(buffer, values)
+        return buffer.getvalue()
+
+    def write(self, stream: TextIO, values: Mapping[str, SlotValue]) -> None:
+        # A callable value writes its own content to the stream, so large
+        # slots such as the page body never have to exist as one string.
+        stream.write(self.chunks[0])
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            value = self._value(values, slot)
+            if isinstance(value, str):
+                stream.write(value)
+            else:
+                value(stream)
+            stream.write(chunk)
+
+    def _value(self, values: Mapping[str, SlotValue], slot: str) -> SlotValue:
+        try:
+            return values[slot]
+        except KeyError:
+            raise ValueError(f"template slot has no value: {slot}") from None
+
+    def __repr__(self) -> str:
+        return f"Template(slots: {self.slots})"
+
+
+_loaded: dict[str, tuple[int, int, Template]] = {}
+
+
+def load_template(path: Path) -> Template:
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _loaded.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    template = Template(Path(path).read_text(encoding="utf-8"))
+    _loaded[key] = (stat.st_mtime_ns, stat.st_size, template)
+    return template
@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from async_build import build_site_async, write_atomic
+from build import build_site
+
+
+class TestAsyncBuild(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.content, self.output, self.template = self.root / "content", self.root / "public", self.root / "template.html"
+        self.template.write_text("<title>{{ Title }}</title><main>{{ Content }}</main>", encoding="utf-8")
+        (self.content / "blog").mkdir(parents=True)
+        (self.content / "index.md").write_text("# Home\n\nWelcome **home**.", encoding="utf-8")
+        for i in range(20):
+            (self.content / "blog" / f"post{i}.md").write_text(f"# Post {i}\n\nSee [home](/index.html).\n\n- one\n- two", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def outputs(self, output_dir: Path) -> dict[str, str]:
+        return {path.relative_to(output_dir).as_posix(): path.read_text(encoding="utf-8") for path in output_dir.rglob("*.html")}
+
+    def test_eq_serial(self) -> None:
+        build_site(self.content, self.root / "serial", self.template, workers=1)
+        result = build_site_async(self.content, self.output, self.template, workers=1, max_open_files=4)
+        actual, expected = self.outputs(self.output), self.outputs(self.root / "serial")
+        self.assertDictEqual(actual, expected)
+        self.assertEqual(len(result.built), 21)
+
+    def test_eq_serial_processes(self) -> None:
+        build_site(self.content, self.root / "serial", self.template, workers=1)
+        build_site_async(self.content, self.output, self.template, workers=2)
+        actual, expected = self.outputs(self.output), self.outputs(self.root / "serial")
+        self.assertDictEqual(actual, expected)
+
+    def test_inline_cache_eq_serial(self) -> None:
+        build_site(self.content, self.root / "serial", self.template, workers=1)
+        build_site_async(self.content, self.output, self.template, workers=1, cache_size=64)
+        actual, expected = self.outputs(self.output), self.outputs(self.root / "serial")
+        self.assertDictEqual(actual, expected)
+
+    def test_links_eq_serial(self) -> None:
+        expected = build_site(self.content, self.root / "serial", self.template, workers=1).links
+        actual = build_site_async(self.content, self.output, self.template, workers=2).links
+        self.assertDictEqual(actual, expected)
+
+    def test_no_temporary_files(self) -> None:
+        build_site_async(self.content, self.output, self.template, workers=1)
+        actual, expected = [path.name for path in self.output.rglob("*.tmp")], []
+        self.assertListEqual(actual, expected)
+
+    def test_rebuild_unchanged(self) -> None:
+        build_site_async(self.content, self.output, self.template, workers=1)
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [result.built, result.skipped], [[], 21]
+        self.assertListEqual(actual, expected)
+
+    def test_page_error(self) -> None:
+        (self.content / "broken.md").write_text("no title here", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            build_site_async(self.content, self.output, self.template, workers=1)
+
+    def test_max_open_files_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            build_site_async(self.content, self.output, self.template, workers=1, max_open_files=0)
+
+
+class TestWriteAtomic(unittest.TestCase):
+    def test_replaces_existing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "page.html"
+            write_atomic(path, "old")
+            write_atomic(path, "new")
+            actual, expected = [path.read_text(encoding="utf-8"), sorted(p.name for p in path.parent.iterdir())], ["new", ["page.html"]]
+            self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
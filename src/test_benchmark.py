@@ -0,0 +1,30 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmark import CORPORA, load_baseline, run_suite, save_results
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_corpora_are_reproducible(self) -> None:
+        for generate in CORPORA.values():
+            actual, expected = generate(2048, random.Random(1)), generate(2048, random.Random(1))
+            self.assertEqual(actual, expected)
+            self.assertGreaterEqual(len(actual), 2048)
+
+    def test_run_suite_save_load(self) -> None:
+        results = run_suite(1024, repeat=1)
+        actual, expected = {(result.corpus, result.stage) for result in results}, {
+            (corpus, stage) for corpus in CORPORA for stage in ("inline", "convert", "render", "blocks")
+        }
+        self.assertSetEqual(actual, expected)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "results.json"
+            save_results(path, results, 1024, 1)
+            baseline = load_baseline(path)
+        self.assertEqual(baseline[("flat", "render")], results[-2].seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import io
+import unittest
+
+from block_markdown import BlockType, block_to_block_type, iter_blocks, markdown_to_html_node, write_markdown_html
+from inline_cache import CacheStats, InlineCache
+
+
+class TestBlockMarkdown(unittest.TestCase):
+    def test_iter_blocks(self) -> None:
+        markdown = "# Title\nFirst line\nsecond line\n\n\n- one\n- two\n\n```\ncode\n\nstill code\n```\n> quote"
+        actual = list(iter_blocks(io.StringIO(markdown)))
+        expected = [
+            (BlockType.HEADING, ["# Title"]),
+            (BlockType.PARAGRAPH, ["First line", "second line"]),
+            (BlockType.UNORDERED_LIST, ["- one", "- two"]),
+            (BlockType.CODE, ["```", "code", "", "still code", "```"]),
+            (BlockType.QUOTE, ["> quote"]),
+        ]
+        self.assertListEqual(actual, expected)
+
+    def test_iter_blocks_is_lazy(self) -> None:
+        def lines():
+            yield "first paragraph\n"
+            yield "\n"
+            raise AssertionError("read past the first block")
+        actual, expected = next(iter_blocks(lines())), (BlockType.PARAGRAPH, ["first paragraph"])
+        self.assertEqual(actual, expected)
+
+    def test_iter_blocks_code_not_closed_error(self) -> None:
+        with self.assertRaises(ValueError):
+            list(iter_blocks(["```", "code"]))
+
+    def test_block_to_block_type(self) -> None:
+        cases = {
+            BlockType.HEADING:        ["###### six"],
+            BlockType.QUOTE:          ["> a", ">b"],
+            BlockType.ORDERED_LIST:   ["1. a", "2. b"],
+            BlockType.PARAGRAPH:      ["1. a", "3. b"],
+        }
+        for expected, lines in cases.items():
+            self.assertEqual(block_to_block_type(lines), expected)
+        self.assertEqual(block_to_block_type(["####### seven"]), BlockType.PARAGRAPH)
+
+    def test_paragraphs(self) -> None:
+        actual = markdown_to_html_node("# Title\n\nSome _text_\nwrapped\n\n\n").to_html()
+        expected = "<div><h1>Title</h1><p>Some <i>text</i> wrapped</p></div>"
+        self.assertEqual(actual, expected)
+
+    def test_lists(self) -> None:
+        actual = markdown_to_html_node("- **a**\n- b\n\n1. first\n2. second").to_html()
+        expected = "<div><ul><li><b>a</b></li><li>b</li></ul><ol><li>first</li><li>second</li></ol></div>"
+        self.assertEqual(actual, expected)
+
+    def test_quote_and_heading(self) -> None:
+        actual = markdown_to_html_node("## Sub _title_\n> quoted\n> text").to_html()
+        expected = "<div><h2>Sub <i>title</i></h2><blockquote>quoted text</blockquote></div>"
+        self.assertEqual(actual, expected)
+
+    def test_code_is_not_inline_parsed(self) -> None:
+        actual = markdown_to_html_node("```\nThis is **not** _parsed_\n```").to_html()
+        expected = "<div><pre><code>This is **not** _parsed_\n</code></pre></div>"
+        self.assertEqual(actual, expected)
+
+    def test_write_markdown_html(self) -> None:
+        markdown = "# Title\n\nbody text\n"
+        stream = io.StringIO()
+        write_markdown_html(io.StringIO(markdown), stream)
+        actual, expected = stream.getvalue(), markdown_to_html_node(markdown).to_html()
+        self.assertEqual(actual, expected)
+
+    def test_escaped(self) -> None:
+        markdown = "# Fish & chips\n\nIf a < b then [go](/q?a=1&b=2)\n\n```\n<div>\n```"
+        stream = io.StringIO()
+        write_markdown_html(markdown.splitlines(), stream)
+        expected = '<div><h1>Fish &amp; chips</h1><p>If a &lt; b then <a href="/q?a=1&amp;b=2">go</a></p><pre><code>&lt;div&gt;\n</code></pre></div>'
+        actual = [stream.getvalue(), markdown_to_html_node(markdown).to_html()]
+        self.assertListEqual(actual, [expected, expected])
+
+    def test_targets_collected(self) -> None:
+        targets: list[str] = []
+        markdown_to_html_node("# [Home](/)\n\nA ![logo](/logo.png)\n\n- [post](post.html)\n\n```\n[not](a-link)\n```", targets)
+        actual, expected = targets, ["/", "/logo.png", "post.html"]
+        self.assertListEqual(actual, expected)
+
+    def test_inline_cache(self) -> None:
+        markdown = "# Page\n\n- [Home](/) & **more**\n- [Blog](/blog)\n\nBody"
+        cache, targets, stream = InlineCache(), [], io.StringIO()
+        for _ in range(3):
+            write_markdown_html(markdown.splitlines(), stream, targets, cache)
+        actual = [stream.getvalue(), targets, cache.stats()["textnodes"]]
+        expected = [markdown_to_html_node(markdown).to_html() * 3, ["/", "/blog"] * 3, CacheStats(8, 4, 4, 4096)]
+        self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from build import build_site
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.content, self.output, self.template = self.root / "content", self.root / "public", self.root / "template.html"
+        self.template.write_text("<title>{{ Title }}</title><main>{{ Content }}</main>", encoding="utf-8")
+        (self.content / "blog").mkdir(parents=True)
+        (self.content / "index.md").write_text("# Home\n\nWelcome **home**.", encoding="utf-8")
+        (self.content / "blog" / "post.md").write_text("# Post\n\nSee [home](/index.html).", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_build_site_serial(self) -> None:
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = sorted(path.relative_to(self.output).as_posix() for path in result.built), ["blog/post.html", "index.html"]
+        self.assertListEqual(actual, expected)
+        actual_html = (self.output / "index.html").read_text(encoding="utf-8")
+        self.assertEqual(actual_html, "<title>Home</title><main><div><h1>Home</h1><p>Welcome <b>home</b>.</p></div></main>")
+
+    def test_build_site_parallel_eq_serial(self) -> None:
+        build_site(self.content, self.root / "serial", self.template, workers=1)
+        build_site(self.content, self.output, self.template, workers=2)
+        for name in ("index.html", "blog/post.html"):
+            actual, expected = (self.output / name).read_text(encoding="utf-8"), (self.root / "serial" / name).read_text(encoding="utf-8")
+            self.assertEqual(actual, expected)
+
+    def test_build_site_inline_cache_eq_uncached(self) -> None:
+        build_site(self.content, self.root / "uncached", self.template, workers=1)
+        for workers in (1, 2):
+            build_site(self.content, self.output, self.template, workers, force=True, cache_size=64)
+            for name in ("index.html", "blog/post.html"):
+                actual, expected = (self.output / name).read_text(encoding="utf-8"), (self.root / "uncached" / name).read_text(encoding="utf-8")
+                self.assertEqual(actual, expected)
+
+    def test_rebuild_unchanged(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [result.built, result.skipped, result.removed], [[], 2, []]
+        self.assertListEqual(actual, expected)
+
+    def test_rebuild_changed_source(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        (self.content / "index.md").write_text("# Home\n\nWelcome back.", encoding="utf-8")
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [result.built, result.skipped], [[self.output / "index.html"], 1]
+        self.assertListEqual(actual, expected)
+        self.assertIn("Welcome back.", (self.output / "index.html").read_text(encoding="utf-8"))
+
+    def test_rebuild_touched_source(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        os.utime(self.content / "index.md", ns=(0, 0))
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [result.built, result.skipped], [[], 2]
+        self.assertListEqual(actual, expected)
+
+    def test_rebuild_changed_template(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        self.template.write_text("{{ Content }}", encoding="utf-8")
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [len(result.built), result.skipped], [2, 0]
+        self.assertListEqual(actual, expected)
+
+    def test_rebuild_removed_source(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        (self.content / "blog" / "post.md").unlink()
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = result.removed, [self.output / "blog" / "post.html"]
+        self.assertListEqual(actual, expected)
+        self.assertFalse((self.output / "blog" / "post.html").exists())
+
+    def test_rebuild_deleted_output(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        (self.output / "index.html").unlink()
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = result.built, [self.output / "index.html"]
+        self.assertListEqual(actual, expected)
+
+    def test_links_indexed(self) -> None:
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = result.links, {"index.md": (), "blog/post.md": ("/index.html",)}
+        self.assertDictEqual(actual, expected)
+
+    def test_links_kept_for_unchanged_pages(self) -> None:
+        build_site(self.content, self.output, self.template, workers=2)
+        result = build_site(self.content, self.output, self.template, workers=1)
+        actual, expected = [result.skipped, result.links["blog/post.md"]], [2, ("/index.html",)]
+        self.assertListEqual(actual, expected)
+
+    def test_force_rebuild(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        result = build_site(self.content, self.output, self.template, workers=1, force=True)
+        actual, expected = len(result.built), 2
+        self.assertEqual(actual, expected)
+
+    def test_force_rebuild_removed_source(self) -> None:
+        build_site(self.content, self.output, self.template, workers=1)
+        (self.content / "blog" / "post.md").unlink()
+        result = build_site(self.content, self.output, self.template, workers=1, force=True)
+        actual, expected = [result.removed, len(result.built)], [[self.output / "blog" / "post.html"], 1]
+        self.assertListEqual(actual, expected)
+        self.assertFalse((self.output / "blog" / "post.html").exists())
+
+    def test_failed_page_keeps_old_output(self) -> None:
+        source, page = self.content / "index.md", self.output / "index.html"
+        build_site(self.content, self.output, self.template, workers=1)
+        expected = page.read_text(encoding="utf-8")
+        original = source.read_text(encoding="utf-8")
+        source.write_text("# Home\n\nWelcome\n\n**broken", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            build_site(self.content, self.output, self.template, workers=1)
+        source.write_text(original, encoding="utf-8")
+        build_site(self.content, self.output, self.template, workers=1)
+        actual = [page.read_text(encoding="utf-8"), sorted(path.name for path in self.output.iterdir() if path.suffix == ".tmp")]
+        self.assertListEqual(actual, [expected, []])
+
+
+if __name__ == "__main__":
+    unittest.main()
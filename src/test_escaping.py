@@ -0,0 +1,36 @@
+import unittest
+
+from escaping import escape_attribute, escape_text, needs_escaping
+
+
+class TestEscaping(unittest.TestCase):
+    def test_escape_text(self) -> None:
+        actual, expected = escape_text('a < b && c > "d"'), 'a &lt; b &amp;&amp; c &gt; "d"'
+        self.assertEqual(actual, expected)
+
+    def test_escape_text_clean_is_same(self) -> None:
+        text = "nothing to escape here"
+        self.assertIs(escape_text(text), text)
+
+    def test_escape_attribute(self) -> None:
+        actual, expected = escape_attribute('/search?q="a"&b=<c>'), "/search?q=&quot;a&quot;&amp;b=&lt;c&gt;"
+        self.assertEqual(actual, expected)
+
+    def test_escape_attribute_none(self) -> None:
+        actual, expected = escape_attribute(None), "None"
+        self.assertEqual(actual, expected)
+
+    def test_escape_attribute_cached(self) -> None:
+        escape_attribute.cache_clear()
+        escape_attribute("/index.html")
+        escape_attribute("/index.html")
+        actual, expected = escape_attribute.cache_info().hits, 1
+        self.assertEqual(actual, expected)
+
+    def test_needs_escaping(self) -> None:
+        actual, expected = [needs_escaping(["plain", "text"]), needs_escaping(["a", "b & c"]), needs_escaping(['say "hi"'])], [False, True, True]
+        self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
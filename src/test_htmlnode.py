@@ -1,6 +1,7 @@
+import io
 import unittest
 
-from htmlnode import HTMLNode, LeafNode, ParentNode
+from htmlnode import HTML_CHUNK_SIZE, CachedNode, HTMLNode, LazyNode, LeafNode, ParentNode, _iter_html
 
 
 class TestHTMLNode(unittest.TestCase):
@@ -26,6 +27,11 @@ class TestHTMLNode(unittest.TestCase):
         actual, expected = repr(outer), "HTMLNode(p, i am a paragraph, children: [HTMLNode(a, i am a link, children: None, {'href': 'https://boot.dev', 'target': '_blank'})], None)"
         self.assertEqual(actual, expected)
 
+    def test_no_instance_dict(self) -> None:
+        nodes = [HTMLNode("p"), LeafNode("b", "bold"), ParentNode("div", [])]
+        actual, expected = [hasattr(node, "__dict__") for node in nodes], [False, False, False]
+        self.assertListEqual(actual, expected)
+
     def test_to_html_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             HTMLNode("a", "i am a link", None, {"href": "https://boot.dev", "target": "_blank"}).to_html()
@@ -46,6 +52,23 @@ class TestLeafNode(unittest.TestCase):
         actual, expected = node.to_html(), '<a href="https://boot.dev" target="_blank">i am a link</a>'
         self.assertEqual(actual, expected)
 
+    def test_leaf_to_html_escaped(self) -> None:
+        node = LeafNode("a", "<b> & co", {"href": '/q?a=1&b="2"'})
+        actual, expected = node.to_html(), '<a href="/q?a=1&amp;b=&quot;2&quot;">&lt;b&gt; &amp; co</a>'
+        self.assertEqual(actual, expected)
+
+    def test_leaf_to_html_value_changed(self) -> None:
+        node = LeafNode("b", "plain")
+        parent = ParentNode("p", [node])
+        rendered = [node.to_html(), parent.to_html()]
+        node.value = "a < b"
+        actual = rendered + [node.to_html(), parent.to_html()]
+        expected = ["<b>plain</b>", "<p><b>plain</b></p>", "<b>a &lt; b</b>", "<p><b>a &lt; b</b></p>"]
+        self.assertListEqual(actual, expected)
+        node.value = None # type: ignore[assignment]
+        with self.assertRaises(ValueError):
+            parent.to_html()
+
     def test_leaf_to_html_no_tag(self) -> None:
         node = LeafNode(None, "Hello, world!")
         actual, expected = node.to_html(), "Hello, world!"
@@ -90,6 +113,134 @@ class TestParentNode(unittest.TestCase):
         with self.assertRaises(ValueError):
             ParentNode("h2", None).to_html() # type: ignore[reportArgumentType]
 
+    def test_iter_html_chunks(self) -> None:
+        node = ParentNode("p", [LeafNode("b", "Bold text"), LeafNode(None, "Normal text")], {"class": "intro"})
+        actual, expected = "".join(node.iter_html()), '<p class="intro"><b>Bold text</b>Normal text</p>'
+        self.assertEqual(actual, expected)
+
+    def test_iter_html_wide_node_streamed(self) -> None:
+        node = ParentNode("div", [LeafNode("b", "x")] * 10_000 + [ParentNode("p", [LeafNode(None, "y")] * (HTML_CHUNK_SIZE * 3))])
+        chunks = list(node.iter_html())
+        actual, expected = ["".join(chunks), max(map(len, chunks)) <= 2 * len("<b>x</b>") * HTML_CHUNK_SIZE, "" in chunks], [node.to_html(), True, False]
+        self.assertListEqual(actual, expected)
+
+    def test_iter_html_subtree_streamed(self) -> None:
+        node = ParentNode("div", [LazyNode(lambda: ParentNode("ul", [LeafNode("li", "x")] * 10_000))])
+        chunks = list(node.iter_html())
+        actual, expected = [len(chunks) > 10, "".join(chunks)], [True, "<div><ul>" + "<li>x</li>" * 10_000 + "</ul></div>"]
+        self.assertListEqual(actual, expected)
+
+    def test_write_html(self) -> None:
+        node = ParentNode("div", [ParentNode("span", [LeafNode("b", "grandchild")]), LeafNode("a", "link", {"href": "https://boot.dev"})])
+        stream = io.StringIO()
+        node.write_html(stream)
+        actual, expected = stream.getvalue(), node.to_html()
+        self.assertEqual(actual, expected)
+
+    def test_to_html_deep_nesting(self) -> None:
+        node: HTMLNode = LeafNode("b", "deep")
+        for _ in range(20_000):
+            node = ParentNode("blockquote", [node])
+        actual, expected = node.to_html(), "<blockquote>" * 20_000 + "<b>deep</b>" + "</blockquote>" * 20_000
+        self.assertEqual(actual, expected)
+
+    def test_to_html_nested_leaf_value_error(self) -> None:
+        node = ParentNode("div", [ParentNode("p", [LeafNode("b", None)])]) # type: ignore[reportArgumentType]
+        with self.assertRaises(ValueError):
+            node.to_html()
+
+    def test_to_html_escaped(self) -> None:
+        node = ParentNode("p", [LeafNode(None, "1 < 2"), LeafNode("code", "a && b"), LeafNode("a", "x", {"href": '"quoted"'})], {"title": "<t>"})
+        actual, expected = node.to_html(), '<p title="&lt;t&gt;">1 &lt; 2<code>a &amp;&amp; b</code><a href="&quot;quoted&quot;">x</a></p>'
+        self.assertEqual(actual, expected)
+
+    def test_iter_html_unchecked_eq(self) -> None:
+        node = ParentNode("p", [LeafNode(None, "plain"), LeafNode("a", "link", {"href": "/a.html"})], {"class": "intro"})
+        actual, expected = "".join(_iter_html(node, False)), node.to_html()
+        self.assertEqual(actual, expected)
+
+    def test_iter_html_unchecked_escapes_other_nodes(self) -> None:
+        cached = CachedNode("b", [LeafNode(None, "a & b")])
+        node = ParentNode("p", [LeafNode(None, "plain"), cached])
+        actual, expected = ["".join(_iter_html(node, False)), cached.to_html()], ["<p>plain<b>a &amp; b</b></p>", "<b>a &amp; b</b>"]
+        self.assertListEqual(actual, expected)
+
+
+class TestCachedNode(unittest.TestCase):
+    def test_to_html_eq_parent_node(self) -> None:
+        children = [LeafNode("b", "Bold"), ParentNode("span", [LeafNode(None, "a & b")])]
+        actual, expected = CachedNode("p", children, {"class": "x"}).to_html(), ParentNode("p", children, {"class": "x"}).to_html()
+        self.assertEqual(actual, expected)
+
+    def test_render_cached(self) -> None:
+        node = CachedNode("p", [LeafNode("b", "Bold")])
+        node.to_html()
+        actual, expected = node.cached, True
+        self.assertEqual(actual, expected)
+
+    def test_immutable_children_and_props(self) -> None:
+        node = CachedNode("a", [LeafNode(None, "home")], {"href": "/"})
+        with self.assertRaises(AttributeError):
+            node.children.append(LeafNode(None, "more")) # type: ignore[union-attr]
+        with self.assertRaises(TypeError):
+            node.props["href"] = "/other" # type: ignore[index]
+
+    def test_mutation_invalidates_ancestors(self) -> None:
+        nav = CachedNode("nav", [LeafNode("a", "home", {"href": "/"})])
+        footer = CachedNode("footer", [LeafNode(None, "bye")])
+        page = CachedNode("body", [ParentNode("header", [nav]), footer])
+        page.to_html()
+        nav.children = [LeafNode("a", "start", {"href": "/"})]
+        actual, expected = [page.cached, nav.cached, footer.cached], [False, False, True]
+        self.assertListEqual(actual, expected)
+        actual_html = page.to_html()
+        self.assertEqual(actual_html, '<body><header><nav><a href="/">start</a></nav></header><footer>bye</footer></body>')
+
+    def test_shared_subtree_invalidates_every_page(self) -> None:
+        nav = CachedNode("nav", [LeafNode(None, "menu")])
+        pages = [CachedNode("body", [nav, LeafNode("p", f"page {i}")]) for i in range(3)]
+        for page in pages:
+            page.to_html()
+        nav.props = {"class": "top"}
+        actual, expected = [page.cached for page in pages], [False, False, False]
+        self.assertListEqual(actual, expected)
+
+    def test_replaced_child_no_longer_invalidates(self) -> None:
+        old = CachedNode("p", [LeafNode(None, "old")])
+        page = CachedNode("div", [old])
+        page.children = [LeafNode(None, "new")]
+        page.to_html()
+        old.tag = "section"
+        actual, expected = page.cached, True
+        self.assertEqual(actual, expected)
+
+
+class TestLazyNode(unittest.TestCase):
+    def test_built_on_render(self) -> None:
+        calls = []
+        lazy = LazyNode(lambda: calls.append(1) or ParentNode("ul", [LeafNode("li", "one")]))
+        page = ParentNode("div", [lazy])
+        actual, expected = [lazy.built, page.to_html(), page.to_html(), len(calls)], [False, "<div><ul><li>one</li></ul></div>", "<div><ul><li>one</li></ul></div>", 1]
+        self.assertListEqual(actual, expected)
+
+    def test_reset_invalidates_ancestors(self) -> None:
+        items = ["one"]
+        lazy = LazyNode(lambda: ParentNode("ul", [LeafNode("li", item) for item in items]))
+        page = CachedNode("div", [lazy])
+        page.to_html()
+        items.append("two")
+        lazy.reset()
+        actual, expected = page.to_html(), "<div><ul><li>one</li><li>two</li></ul></div>"
+        self.assertEqual(actual, expected)
+
+    def test_cached_node_inside_lazy_invalidates_ancestors(self) -> None:
+        inner = CachedNode("p", [LeafNode(None, "text")])
+        page = CachedNode("div", [LazyNode(lambda: inner)])
+        page.to_html()
+        inner.tag = "span"
+        actual, expected = page.to_html(), "<div><span>text</span></div>"
+        self.assertEqual(actual, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
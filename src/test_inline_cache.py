@@ -0,0 +1,64 @@
+import unittest
+
+from inline_cache import CacheStats, InlineCache, LRUCache
+from markdown import text_to_textnodes
+from textnode import TextNode, TextType
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_hits_and_misses(self) -> None:
+        cache: LRUCache[str] = LRUCache(2)
+        for key in ("a", "b", "a", "a"):
+            cache.get(key, str.upper)
+        actual, expected = cache.stats(), CacheStats(2, 2, 2, 2)
+        self.assertEqual(actual, expected)
+
+    def test_evicts_least_recently_used(self) -> None:
+        calls = []
+        cache: LRUCache[str] = LRUCache(2)
+        for key in ("a", "b", "a", "c", "b"):
+            cache.get(key, lambda key: calls.append(key) or key)
+        actual, expected = calls, ["a", "b", "c", "b"]
+        self.assertListEqual(actual, expected)
+
+    def test_size_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+class TestInlineCache(unittest.TestCase):
+    def test_text_to_textnodes_eq(self) -> None:
+        text = "This is **text** with a [link](https://boot.dev)"
+        cache = InlineCache()
+        cache.text_to_textnodes(text)
+        actual, expected = cache.text_to_textnodes(text), text_to_textnodes(text)
+        self.assertListEqual(actual, expected)
+
+    def test_text_to_textnodes_returns_copies(self) -> None:
+        cache = InlineCache()
+        cache.text_to_textnodes("**footer**")[0].text = "changed"
+        actual, expected = cache.text_to_textnodes("**footer**"), [TextNode("footer", TextType.BOLD)]
+        self.assertListEqual(actual, expected)
+
+    def test_text_to_html(self) -> None:
+        cache = InlineCache()
+        actual, expected = cache.text_to_html("Go _home_ [now](/)"), 'Go <i>home</i> <a href="/">now</a>'
+        self.assertEqual(actual, expected)
+
+    def test_stats(self) -> None:
+        cache = InlineCache(8)
+        for _ in range(3):
+            cache.text_to_html("nav")
+        actual, expected = cache.stats(), {"textnodes": CacheStats(0, 0, 0, 8), "html": CacheStats(2, 1, 1, 8)}
+        self.assertDictEqual(actual, expected)
+
+    def test_errors_not_cached(self) -> None:
+        cache = InlineCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.text_to_html("**unclosed")
+        self.assertEqual(cache.stats()["html"].misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
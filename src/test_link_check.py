@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from link_check import check_links, resolve_target
+
+
+class TestResolveTarget(unittest.TestCase):
+    def test_relative(self) -> None:
+        actual, expected = [resolve_target("blog", "post.html"), resolve_target("blog", "../index.html")], ["blog/post.html", "index.html"]
+        self.assertListEqual(actual, expected)
+
+    def test_absolute(self) -> None:
+        actual, expected = [resolve_target("blog", "/about.html"), resolve_target("blog", "/a/./b.html"), resolve_target("", "/")], ["about.html", "a/b.html", ""]
+        self.assertListEqual(actual, expected)
+
+    def test_query_and_fragment(self) -> None:
+        actual, expected = resolve_target("", "img/a.png?v=1#top"), "img/a.png"
+        self.assertEqual(actual, expected)
+
+    def test_unchecked(self) -> None:
+        targets = ["https://www.boot.dev", "//cdn.example.com/a.js", "mailto:me@example.com", "#top"]
+        actual, expected = [resolve_target("", target) for target in targets], [None] * 4
+        self.assertListEqual(actual, expected)
+
+
+class TestCheckLinks(unittest.TestCase):
+    def test_broken(self) -> None:
+        links = {"index.md": ("/blog/post.html", "/missing.html"), "blog/post.md": ("../index.html", "gone.png")}
+        actual, expected = check_links(links).broken, [("index.md", "/missing.html"), ("blog/post.md", "gone.png")]
+        self.assertListEqual(actual, expected)
+
+    def test_directory_index(self) -> None:
+        links = {"index.md": ("/blog/", "/blog"), "blog/index.md": ("/",)}
+        actual, expected = check_links(links), ([], [])
+        self.assertEqual(actual, expected)
+
+    def test_orphans(self) -> None:
+        links = {"index.md": ("/a.html",), "a.md": (), "b.md": ("/b.html", "/a.html"), "c.md": ("/b.html",)}
+        actual, expected = check_links(links).orphans, ["c.md"]
+        self.assertListEqual(actual, expected)
+
+    def test_static_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "images").mkdir()
+            (Path(tmp) / "images" / "logo.png").write_bytes(b"")
+            links = {"index.md": ("/images/logo.png", "/images/other.png")}
+            actual, expected = check_links(links, Path(tmp)).broken, [("index.md", "/images/other.png")]
+            self.assertListEqual(actual, expected)
+
+    def test_stale_pages_and_artifacts_not_targets(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.html", "b.html", "b.html.tmp", ".ssg-manifest.json"):
+                (Path(tmp) / name).write_text("", encoding="utf-8")
+            links = {"a.md": ("/b.html", "/b.html.tmp", "/.ssg-manifest.json", "/a.html")}
+            actual = check_links(links, Path(tmp)).broken
+            expected = [("a.md", "/b.html"), ("a.md", "/b.html.tmp"), ("a.md", "/.ssg-manifest.json")]
+            self.assertListEqual(actual, expected)
+
+    def test_external_ignored(self) -> None:
+        actual, expected = check_links({"index.md": ("https://www.tolkiensociety.org", "#top")}), ([], [])
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import contextlib
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from main import main
+from page import render_page
+from template import Template
+
+
+class TestMain(unittest.TestCase):
+    markdown = "# Home\n\nWelcome **home**, see [about](/about.html)."
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.page, self.template = self.root / "index.md", self.root / "template.html"
+        self.page.write_text(self.markdown, encoding="utf-8")
+        self.template.write_text("<title>{{ Title }}</title><main>{{ Content }}</main>", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def render(self, argv: list[str], stdin: str = "") -> str:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), mock.patch("sys.stdin", io.StringIO(stdin)):
+            main(argv)
+        return stdout.getvalue()
+
+    def test_render_page(self) -> None:
+        actual = self.render(["render", str(self.page)])
+        expected = '<div><h1>Home</h1><p>Welcome <b>home</b>, see <a href="/about.html">about</a>.</p></div>'
+        self.assertEqual(actual, expected)
+
+    def test_render_stdin_eq_page(self) -> None:
+        actual, expected = self.render(["render"], self.markdown), self.render(["render", str(self.page)])
+        self.assertEqual(actual, expected)
+
+    def test_render_template_to_file(self) -> None:
+        output = self.root / "index.html"
+        self.render(["render", str(self.page), "--template", str(self.template), "-o", str(output)])
+        actual, expected = output.read_text(encoding="utf-8"), render_page(self.markdown, Template(self.template.read_text(encoding="utf-8")))
+        self.assertEqual(actual, expected)
+
+    def test_build_command(self) -> None:
+        content, output = self.root / "content", self.root / "public"
+        content.mkdir()
+        (content / "index.md").write_text(self.markdown, encoding="utf-8")
+        (content / "about.md").write_text("# About\n\nBack [home](/index.html).", encoding="utf-8")
+        args = ["--content", str(content), "--output", str(output), "--template", str(self.template), "--workers", "1"]
+        actual = [self.render(["build", *args]), self.render(args), sorted(path.name for path in output.glob("*.html"))]
+        expected = [f"built 2 pages, 0 unchanged, 0 removed in {output}\n", f"built 0 pages, 2 unchanged, 0 removed in {output}\n", ["about.html", "index.html"]]
+        self.assertListEqual(actual, expected)
+
+    def test_build_error_names_page(self) -> None:
+        content, output = self.root / "content", self.root / "public"
+        content.mkdir()
+        (content / "index.md").write_text(self.markdown, encoding="utf-8")
+        (content / "about.md").write_text("# About\n\n**broken", encoding="utf-8")
+        args = ["--content", str(content), "--output", str(output), "--template", str(self.template), "--force"]
+        for mode in (["--workers", "1"], ["--workers", "2"], ["--workers", "1", "--async-io"], ["--workers", "2", "--async-io"]):
+            with self.subTest(mode=mode):
+                stderr = io.StringIO()
+                with self.assertRaises(SystemExit) as exit, contextlib.redirect_stderr(stderr):
+                    self.render(["build", *args, *mode])
+                actual = [exit.exception.code, stderr.getvalue()]
+                expected = [1, f"error: {content / 'about.md'}: invalid markdown, formatted section not closed\n"]
+                self.assertListEqual(actual, expected)
+
+    def test_render_imports_lazily(self) -> None:
+        # A single page render must not load the build machinery or compile
+        # patterns it does not use; with a template it still skips the build.
+        code = (
+            "import io, sys; import main; main.render_page_to('# Title', None, io.StringIO()); "
+            "import markdown; print(sorted(name for name in ('asyncio', 'build', 'concurrent.futures', 'watch', 'pathlib') if name in sys.modules), markdown.compiled.cache_info().currsize); "
+            f"main.render_page_to('# Title', {str(self.template)!r}, io.StringIO()); "
+            "print(sorted(name for name in ('asyncio', 'build', 'concurrent.futures', 'watch', 'manifest', 'hashlib') if name in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent, capture_output=True, text=True, check=True)
+        actual, expected = result.stdout.split("\n"), ["[] 0", "[]", ""]
+        self.assertListEqual(actual, expected)
+
+    def test_run_as_module(self) -> None:
+        result = subprocess.run([sys.executable, "-m", "src", "render", str(self.page)], cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True)
+        actual, expected = result.stdout, self.render(["render", str(self.page)])
+        self.assertEqual(actual, expected)
+
+if __name__ == "__main__":
+    unittest.main()
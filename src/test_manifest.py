@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from manifest import Manifest, SourceRecord, snapshot, text_digest
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.source = self.root / "page.md"
+        self.source.write_text("# Page", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_save_load_eq(self) -> None:
+        manifest = Manifest("abc", {"page.md": SourceRecord(1, 2, "digest", "page.html")})
+        manifest.save(self.root / "manifest.json")
+        loaded = Manifest.load(self.root / "manifest.json")
+        actual, expected = [loaded.template_digest, loaded.sources], ["abc", manifest.sources]
+        self.assertListEqual(actual, expected)
+
+    def test_load_missing(self) -> None:
+        actual, expected = Manifest.load(self.root / "missing.json").sources, {}
+        self.assertDictEqual(actual, expected)
+
+    def test_load_corrupt(self) -> None:
+        (self.root / "manifest.json").write_text("{not json", encoding="utf-8")
+        actual, expected = Manifest.load(self.root / "manifest.json").sources, {}
+        self.assertDictEqual(actual, expected)
+
+    def test_is_fresh(self) -> None:
+        manifest = Manifest("t", {"page.md": snapshot(self.source, "page.html")})
+        actual, expected = manifest.is_fresh("page.md", self.source, "page.html", "t"), manifest.sources["page.md"]
+        self.assertEqual(actual, expected)
+
+    def test_is_fresh_template_changed(self) -> None:
+        manifest = Manifest("t", {"page.md": snapshot(self.source, "page.html")})
+        self.assertIsNone(manifest.is_fresh("page.md", self.source, "page.html", "other"))
+
+    def test_is_fresh_content_changed(self) -> None:
+        manifest = Manifest("t", {"page.md": snapshot(self.source, "page.html")})
+        self.source.write_text("# Edit", encoding="utf-8")
+        self.assertIsNone(manifest.is_fresh("page.md", self.source, "page.html", "t"))
+
+    def test_text_digest(self) -> None:
+        actual, expected = text_digest("abc"), "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,11 @@ class TestInlineMarkdown(unittest.TestCase):
         expected = [TextNode("This is text with a ", TextType.TEXT), TextNode("link", TextType.LINK, "https://boot.dev"), TextNode(" and ", TextType.TEXT), TextNode("another link", TextType.LINK, "https://blog.boot.dev"), TextNode(" with text that follows", TextType.TEXT)]
         self.assertListEqual(actual, expected)
 
+    def test_split_links_skips_images(self) -> None:
+        node = TextNode("![l](u.png)[l](u.html)", TextType.TEXT)
+        actual, expected = split_nodes_link([node]), [TextNode("![l](u.png)", TextType.TEXT), TextNode("l", TextType.LINK, "u.html")]
+        self.assertListEqual(actual, expected)
+
     def test_text_to_textnodes(self):
         actual = text_to_textnodes("This is **text** with an _italic_ word and a `code block` and an ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://boot.dev)")
         expected = [
@@ -94,6 +99,23 @@ class TestInlineMarkdown(unittest.TestCase):
         ]
         self.assertListEqual(actual, expected)
 
+    def test_text_to_textnodes_bold_binds_first(self) -> None:
+        actual = text_to_textnodes("**snake_case_name** and _italic_")
+        expected = [TextNode("snake_case_name", TextType.BOLD), TextNode(" and ", TextType.TEXT), TextNode("italic", TextType.ITALIC)]
+        self.assertListEqual(actual, expected)
+
+    def test_text_to_textnodes_link_after_image(self) -> None:
+        actual = text_to_textnodes("![img](a.png)[link](b.html)")
+        expected = [TextNode("img", TextType.IMAGE, "a.png"), TextNode("link", TextType.LINK, "b.html")]
+        self.assertListEqual(actual, expected)
+
+    def test_text_to_textnodes_empty(self) -> None:
+        self.assertListEqual(text_to_textnodes(""), [])
+
+    def test_text_to_textnodes_not_closed_error(self) -> None:
+        with self.assertRaises(ValueError):
+            text_to_textnodes("**bold** and _italic")
+
 
 if __name__ == "__main__":
     unittest.main()
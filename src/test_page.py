@@ -0,0 +1,26 @@
+import unittest
+
+from page import extract_title, render_page
+from template import Template
+
+
+class TestPage(unittest.TestCase):
+    def test_extract_title(self) -> None:
+        actual, expected = extract_title("intro\n#  Hello  \n## Sub"), "Hello"
+        self.assertEqual(actual, expected)
+
+    def test_extract_title_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            extract_title("## only a subheading")
+
+    def test_render_page(self) -> None:
+        actual, expected = render_page("# Hi\n\nthere", Template("{{ Title }}|{{ Content }}")), "Hi|<div><h1>Hi</h1><p>there</p></div>"
+        self.assertEqual(actual, expected)
+
+    def test_render_page_title_escaped(self) -> None:
+        actual, expected = render_page("# Q&A <1>", Template("{{ Title }}")), "Q&amp;A &lt;1&gt;"
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import markdown
+import textnode
+from block_markdown import markdown_to_html_node, write_markdown_html
+from build import build_site
+from markdown import text_to_textnodes
+from profiling import TOTAL, Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_restores_functions(self) -> None:
+        originals = [markdown._scan_delimited, textnode.text_node_to_html_node, textnode.LeafNode.to_html]
+        with Profiler():
+            self.assertIsNot(markdown._scan_delimited, originals[0])
+        actual, expected = [markdown._scan_delimited, textnode.text_node_to_html_node, textnode.LeafNode.to_html], originals
+        self.assertListEqual(actual, expected)
+
+    def test_stage_node_counts(self) -> None:
+        with Profiler() as profiler:
+            text_to_textnodes("**bold** and _italic_ with a [link](/a.html) and ![img](/b.png)")
+        totals = profiler.totals()
+        actual, expected = [totals["delimiters"].nodes, totals["images_links"].nodes], [2, 5]
+        self.assertListEqual(actual, expected)
+
+    def test_conversion_stages(self) -> None:
+        with Profiler() as profiler:
+            markdown_to_html_node("# Title\n\nSome **text**").to_html()
+        totals = profiler.totals()
+        actual, expected = [totals["blocks"].calls, totals["to_html_node"].calls, totals["to_html"].calls], [2, 3, 1]
+        self.assertListEqual(actual, expected)
+
+    def test_streamed_page_stages(self) -> None:
+        with Profiler() as profiler:
+            write_markdown_html(["# Title", "", "Some **text**"], io.StringIO())
+        totals = profiler.totals()
+        actual, expected = [totals["blocks"].calls, totals["to_html"].calls], [2, 2]
+        self.assertListEqual(actual, expected)
+
+    def test_per_page_stats(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "content").mkdir()
+            (root / "content" / "index.md").write_text("# Home\n\n**hi**", encoding="utf-8")
+            (root / "template.html").write_text("{{ Content }}", encoding="utf-8")
+            with Profiler() as profiler:
+                build_site(root / "content", root / "public", root / "template.html", workers=1)
+        pages = {page for page, _ in profiler.stats}
+        actual, expected = pages, {str(root / "content" / "index.md")}
+        self.assertSetEqual(actual, expected)
+        self.assertNotIn(TOTAL, pages)
+        self.assertIn("index.md", profiler.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
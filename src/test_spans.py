@@ -0,0 +1,60 @@
+import unittest
+
+from markdown import scan_inline, scan_inline_into, text_to_textnodes
+from spans import SpanArray, TextSpans, spans_to_html, text_to_html, text_to_spans
+from textnode import TextType, text_node_to_html_node
+
+
+class TestTextSpans(unittest.TestCase):
+    text = "This is **text** with an _italic_ word and a `code block` and an ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://boot.dev)"
+
+    def test_spans_eq_textnodes(self) -> None:
+        actual, expected = text_to_spans(self.text).to_textnodes(), text_to_textnodes(self.text)
+        self.assertListEqual(actual, expected)
+
+    def test_offsets(self) -> None:
+        spans = text_to_spans("a **b** [c](d)")
+        actual = [list(spans.starts), list(spans.ends), list(spans.url_starts), list(spans.url_ends)]
+        expected = [[0, 4, 7, 9], [2, 5, 8, 10], [-1, -1, -1, 12], [-1, -1, -1, 13]]
+        self.assertListEqual(actual, expected)
+
+    def test_offsets_view_data(self) -> None:
+        spans = text_to_spans("a **b**")
+        starts = spans.starts
+        spans.data[0] = 1
+        actual, expected = list(starts), [1, 4]
+        self.assertListEqual(actual, expected)
+
+    def test_span_array_eq_scan_inline(self) -> None:
+        spans = SpanArray("l")
+        scan_inline_into(self.text, spans)
+        actual, expected = [len(spans), list(spans)], [len(scan_inline(self.text)), [field for span in scan_inline(self.text) for field in span]]
+        self.assertListEqual(actual, expected)
+
+    def test_type_codes(self) -> None:
+        spans = text_to_spans("**b**_i_")
+        actual, expected = [node.text_type for node in spans], [TextType.BOLD, TextType.ITALIC]
+        self.assertListEqual(actual, expected)
+
+    def test_empty(self) -> None:
+        actual, expected = [len(text_to_spans("")), spans_to_html(TextSpans(""))], [0, ""]
+        self.assertListEqual(actual, expected)
+
+    def test_html_eq_leaf_nodes(self) -> None:
+        actual = text_to_html(self.text)
+        expected = "".join(text_node_to_html_node(node).to_html() for node in text_to_textnodes(self.text))
+        self.assertEqual(actual, expected)
+
+    def test_html_escaped_eq_leaf_nodes(self) -> None:
+        text = 'a < b & **c > d** [x & y](/q?a=1&b="2") ![<alt>](/i.png)'
+        actual = text_to_html(text)
+        expected = "".join(text_node_to_html_node(node).to_html() for node in text_to_textnodes(text))
+        self.assertEqual(actual, expected)
+
+    def test_error(self) -> None:
+        with self.assertRaises(ValueError):
+            text_to_spans("`unclosed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from template import Template, load_template
+
+
+class TestTemplate(unittest.TestCase):
+    def test_parse(self) -> None:
+        template = Template("<title>{{ Title }}</title>{{Content}}!")
+        actual, expected = [template.chunks, template.slots], [["<title>", "</title>", "!"], ["Title", "Content"]]
+        self.assertListEqual(actual, expected)
+
+    def test_render(self) -> None:
+        actual = Template("<h1>{{ Title }}</h1>{{ Content }}<i>{{ Title }}</i>").render({"Title": "Hi", "Content": "<p>body</p>"})
+        expected = "<h1>Hi</h1><p>body</p><i>Hi</i>"
+        self.assertEqual(actual, expected)
+
+    def test_render_without_slots(self) -> None:
+        actual, expected = Template("static page").render({}), "static page"
+        self.assertEqual(actual, expected)
+
+    def test_write_callable_value(self) -> None:
+        stream = io.StringIO()
+        Template("<main>{{ Content }}</main>").write(stream, {"Content": lambda out: out.write("streamed")})
+        actual, expected = stream.getvalue(), "<main>streamed</main>"
+        self.assertEqual(actual, expected)
+
+    def test_missing_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            Template("{{ Title }}").render({})
+
+    def test_values_are_not_reparsed(self) -> None:
+        actual, expected = Template("{{ Content }}").render({"Content": "{{ Title }}"}), "{{ Title }}"
+        self.assertEqual(actual, expected)
+
+    def test_load_template_reloads_on_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "template.html"
+            path.write_text("{{ Title }}", encoding="utf-8")
+            first = load_template(path)
+            self.assertIs(load_template(path), first)
+            path.write_text("<b>{{ Title }}</b>", encoding="utf-8")
+            os.utime(path, ns=(0, 0))
+            actual, expected = load_template(path).chunks, ["<b>", "</b>"]
+            self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
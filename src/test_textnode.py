@@ -1,6 +1,6 @@
 import unittest
 
-from textnode import TextNode, TextType, text_node_to_html_node
+from textnode import TextNode, TextType, text_node_to_html, text_node_to_html_node
 
 
 class TestTextNode(unittest.TestCase):
@@ -29,6 +29,10 @@ class TestTextNode(unittest.TestCase):
         actual, expected = repr(node), "TextNode(This is a text node, text, https://www.boot.dev)"
         self.assertEqual(actual, expected)
 
+    def test_no_instance_dict(self) -> None:
+        node = TextNode("This is a text node", TextType.TEXT)
+        self.assertFalse(hasattr(node, "__dict__"))
+
 
 class TestTextNodeToHTMLNode(unittest.TestCase):
     def test_text(self) -> None:
@@ -75,5 +79,32 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
             text_node_to_html_node(node2)
 
 
+class TestTextNodeToHTML(unittest.TestCase):
+    def test_matches_leaf_node(self) -> None:
+        nodes = [
+            TextNode("plain", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode("italic", TextType.ITALIC),
+            TextNode("code", TextType.CODE),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+            TextNode("image", TextType.IMAGE, "https://boot.dev/a.png"),
+            TextNode("no url", TextType.LINK),
+            TextNode("a < b & c", TextType.CODE),
+            TextNode("<alt>", TextType.IMAGE, '/i.png?a="1"&b=2'),
+        ]
+        actual, expected = [text_node_to_html(node) for node in nodes], [text_node_to_html_node(node).to_html() for node in nodes]
+        self.assertListEqual(actual, expected)
+
+    def test_image(self) -> None:
+        node = TextNode("This is an image", TextType.IMAGE, "https://boot.dev")
+        actual, expected = text_node_to_html(node), '<img src="https://boot.dev" alt="This is an image"></img>'
+        self.assertEqual(actual, expected)
+
+    def test_error(self) -> None:
+        node = TextNode("This is an invalid text node", "blockquote", "some_url") # type: ignore[reportArgumentType]
+        with self.assertRaises(ValueError):
+            text_node_to_html(node)
+
+
 if __name__ == "__main__":
     unittest.main()
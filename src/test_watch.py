@@ -0,0 +1,119 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from build import build_site
+from watch import InotifyWatcher, PollingWatcher, SiteWatcher, create_watcher
+
+
+class TestWatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.content, self.output, self.template = self.root / "content", self.root / "public", self.root / "template.html"
+        self.template.write_text("{{ Title }}|{{ Content }}", encoding="utf-8")
+        self.content.mkdir()
+        (self.content / "index.md").write_text("# Home", encoding="utf-8")
+        (self.content / "about.md").write_text("# About", encoding="utf-8")
+        build_site(self.content, self.output, self.template, workers=1)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_polling_watcher_changes(self) -> None:
+        watcher = PollingWatcher(self.content, self.template, interval=0)
+        (self.content / "index.md").write_text("# Home page", encoding="utf-8")
+        (self.content / "about.md").unlink()
+        (self.content / "new.md").write_text("# New", encoding="utf-8")
+        actual = watcher.changes(0)
+        expected = {os.path.abspath(self.content / name) for name in ("index.md", "about.md", "new.md")}
+        self.assertSetEqual(actual, expected)
+
+    def test_inotify_watcher_changes(self) -> None:
+        watcher = create_watcher(self.content, self.template)
+        if not isinstance(watcher, InotifyWatcher):
+            self.skipTest("inotify is not available")
+        try:
+            (self.content / "blog").mkdir()
+            (self.content / "blog" / "post.md").write_text("# Post", encoding="utf-8")
+            self.template.write_text("{{ Content }}", encoding="utf-8")
+            changed: set[str] = set()
+            for _ in range(3):
+                changed |= watcher.changes(0.2) or set()
+            self.assertIn(os.path.abspath(self.content / "blog" / "post.md"), changed)
+            self.assertIn(os.path.abspath(self.template), changed)
+        finally:
+            watcher.close()
+
+    def test_handle_rebuilds_only_changed_page(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        (self.content / "index.md").write_text("# Welcome", encoding="utf-8")
+        about_mtime = (self.output / "about.html").stat().st_mtime_ns
+        actual, expected = site.handle({os.path.abspath(self.content / "index.md")}), ["index.md"]
+        self.assertListEqual(actual, expected)
+        self.assertEqual((self.output / "index.html").read_text(encoding="utf-8"), "Welcome|<div><h1>Welcome</h1></div>")
+        self.assertEqual((self.output / "about.html").stat().st_mtime_ns, about_mtime)
+
+    def test_handle_unchanged_content(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        actual, expected = site.handle({os.path.abspath(self.content / "index.md")}), []
+        self.assertListEqual(actual, expected)
+
+    def test_handle_removed_page(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        (self.content / "about.md").unlink()
+        site.handle({os.path.abspath(self.content / "about.md")})
+        site.save()
+        self.assertFalse((self.output / "about.html").exists())
+        actual, expected = build_site(self.content, self.output, self.template, workers=1).skipped, 1
+        self.assertEqual(actual, expected)
+
+    def test_handle_error_keeps_rebuilding_batch(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        (self.content / "about.md").write_text("No title", encoding="utf-8")
+        (self.content / "index.md").write_text("# Welcome", encoding="utf-8")
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            rebuilt = site.handle({os.path.abspath(self.content / "about.md"), os.path.abspath(self.content / "index.md")})
+        actual, expected = [rebuilt, stdout.getvalue()], [["index.md"], f"error: {self.content / 'about.md'}: invalid markdown, page has no h1 title\n"]
+        self.assertListEqual(actual, expected)
+        self.assertEqual((self.output / "index.html").read_text(encoding="utf-8"), "Welcome|<div><h1>Welcome</h1></div>")
+
+    def test_handle_error_keeps_old_output(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        source, page = self.content / "about.md", self.output / "about.html"
+        source.write_text("# About\n\nUs\n\n**broken", encoding="utf-8")
+        with contextlib.redirect_stdout(io.StringIO()):
+            site.handle({os.path.abspath(source)})
+        self.assertEqual(page.read_text(encoding="utf-8"), "About|<div><h1>About</h1></div>")
+        source.write_text("# About\n\nUs", encoding="utf-8")
+        actual, expected = site.handle({os.path.abspath(source)}), ["about.md"]
+        self.assertListEqual(actual, expected)
+        self.assertEqual(page.read_text(encoding="utf-8"), "About|<div><h1>About</h1><p>Us</p></div>")
+
+    def test_handle_template_change_with_broken_page(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        (self.content / "about.md").write_text("# About\n\n**broken", encoding="utf-8")
+        self.template.write_text("<main>{{ Content }}</main>", encoding="utf-8")
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            rebuilt = site.handle({os.path.abspath(self.template)})
+        (self.content / "index.md").write_text("# Welcome", encoding="utf-8")
+        actual = [rebuilt, site.handle({os.path.abspath(self.content / "index.md")}), (self.output / "index.html").read_text(encoding="utf-8")]
+        expected = [["index.md"], ["index.md"], "<main><div><h1>Welcome</h1></div></main>"]
+        self.assertListEqual(actual, expected)
+        self.assertIn(f"error: {self.content / 'about.md'}: ", stdout.getvalue())
+
+    def test_handle_template_change(self) -> None:
+        site = SiteWatcher(self.content, self.output, self.template)
+        self.template.write_text("<main>{{ Content }}</main>", encoding="utf-8")
+        site.handle({os.path.abspath(self.template)})
+        actual, expected = (self.output / "about.html").read_text(encoding="utf-8"), "<main><div><h1>About</h1></div></main>"
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
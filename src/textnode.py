@@ -1,5 +1,6 @@
 from enum import Enum
 
+from escaping import escape_attribute, escape_text
 from htmlnode import LeafNode
 
 
@@ -13,6 +14,8 @@ class TextType(Enum):
 
 
 class TextNode():
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(
         self,
         text:      str,
@@ -34,19 +37,60 @@ class TextNode():
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
 
 
+# Tags for the text types that render as a plain element around their text;
+# links and images carry their url as a prop and have their own renderers.
+HTML_TAGS: dict[TextType, str | None] = {
+    TextType.TEXT:   None,
+    TextType.BOLD:   "b",
+    TextType.ITALIC: "i",
+    TextType.CODE:   "code",
+}
+
+TAG_OPEN  = {text_type: f"<{tag}>" if tag else "" for text_type, tag in HTML_TAGS.items()}
+TAG_CLOSE = {text_type: f"</{tag}>" if tag else "" for text_type, tag in HTML_TAGS.items()}
+
+
+def link_to_html_node(text_node: TextNode) -> LeafNode:
+    return LeafNode("a", text_node.text, {"href": text_node.url})
+
+
+def image_to_html_node(text_node: TextNode) -> LeafNode:
+    return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
+
+
+def link_to_html(text_node: TextNode) -> str:
+    return f'<a href="{escape_attribute(text_node.url)}">{escape_text(text_node.text)}</a>'
+
+
+def image_to_html(text_node: TextNode) -> str:
+    return f'<img src="{escape_attribute(text_node.url)}" alt="{escape_attribute(text_node.text)}"></img>'
+
+
+HTML_NODE_BUILDERS = {TextType.LINK: link_to_html_node, TextType.IMAGE: image_to_html_node}
+HTML_RENDERERS     = {TextType.LINK: link_to_html,      TextType.IMAGE: image_to_html}
+
+
 def text_node_to_html_node(text_node: TextNode) -> LeafNode:
-    match text_node.text_type:
-        case TextType.TEXT:
-            return LeafNode(None, text_node.text)
-        case TextType.BOLD:
-            return LeafNode("b", text_node.text)
-        case TextType.ITALIC:
-            return LeafNode("i", text_node.text)
-        case TextType.CODE:
-            return LeafNode("code", text_node.text)
-        case TextType.LINK:
-            return LeafNode("a", text_node.text, {"href": text_node.url})
-        case TextType.IMAGE:
-            return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-        case _:
-            raise ValueError(f"invalid text type: {text_node.text_type}")
+    text_type = text_node.text_type
+    if text_type in HTML_TAGS:
+        return LeafNode(HTML_TAGS[text_type], text_node.text)
+    build = HTML_NODE_BUILDERS.get(text_type)
+    if build is None:
+        raise ValueError(f"invalid text type: {text_type}")
+    return build(text_node)
+
+
+def text_node_to_html(text_node: TextNode) -> str:
+    # Renders the same html as text_node_to_html_node(text_node).to_html()
+    # with one string format and no intermediate LeafNode.
+    text_type = text_node.text_type
+    open_tag = TAG_OPEN.get(text_type)
+    if open_tag is not None:
+        text = text_node.text
+        if "&" in text or "<" in text or ">" in text:
+            text = escape_text(text)
+        return f"{open_tag}{text}{TAG_CLOSE[text_type]}"
+    render = HTML_RENDERERS.get(text_type)
+    if render is None:
+        raise ValueError(f"invalid text type: {text_type}")
+    return render(text_node)
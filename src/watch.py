@@ -0,0 +1,234 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from build import build_site, create_cache, find_pages, generate_page, output_name
+from manifest import MANIFEST_NAME, Manifest, file_digest, snapshot
+from template import load_template
+
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_Q_OVERFLOW  = 0x00004000
+IN_ISDIR       = 0x40000000
+WATCH_MASK     = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+INOTIFY_EVENT  = struct.Struct("iIII")
+
+# Returned by a watcher in place of a set of paths when it lost track of
+# individual changes and the whole tree has to be compared against the manifest.
+RESCAN = None
+
+
+class PollingWatcher():
+    def __init__(self, content_dir: Path, template_path: Path, interval: float = 0.2) -> None:
+        self.content_dir   = content_dir
+        self.template_path = template_path
+        self.interval      = interval
+        self._state        = self._scan()
+
+    def changes(self, timeout: float) -> set[str] | None:
+        time.sleep(min(timeout, self.interval))
+        state = self._scan()
+        changed = {path for path in state.keys() | self._state.keys() if state.get(path) != self._state.get(path)}
+        self._state = state
+        return changed
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        state = {}
+        for path in [self.template_path] + [self.content_dir / name for name in find_pages(self.content_dir)]:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            state[os.path.abspath(path)] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+
+class InotifyWatcher():
+    def __init__(self, content_dir: Path, template_path: Path) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: dict[int, str] = {}
+        self._content  = os.path.abspath(content_dir)
+        self._template = os.path.abspath(template_path)
+        self._add_watch(os.path.dirname(self._template))
+        for directory, _, _ in os.walk(self._content):
+            self._add_watch(directory)
+
+    def changes(self, timeout: float) -> set[str] | None:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed: set[str] = set()
+        buffer = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+            name = buffer[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b"\0")
+            offset += INOTIFY_EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                return RESCAN
+            if wd not in self._directories:
+                continue
+
+            path = os.path.join(self._directories[wd], os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if not path.startswith(self._content + os.sep):
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may land in a new directory before it is watched.
+                    for directory, _, files in os.walk(path):
+                        self._add_watch(directory)
+                        changed.update(os.path.join(directory, file) for file in files)
+                elif mask & IN_MOVED_FROM:
+                    return RESCAN
+                continue
+            if path.endswith(".md") or path == self._template:
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._directories[wd] = directory
+
+
+def create_watcher(content_dir: Path, template_path: Path) -> InotifyWatcher | PollingWatcher:
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(content_dir, template_path)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(content_dir, template_path)
+
+
+class SiteWatcher():
+    def __init__(
+        self,
+        content_dir:   Path,
+        output_dir:    Path,
+        template_path: Path,
+        workers:       int | None = None,
+        cache_size:    int | None = None
+    ) -> None:
+        self.content_dir   = content_dir
+        self.output_dir    = output_dir
+        self.template_path = template_path
+        self.workers       = workers
+        self.cache_size    = cache_size
+        # Kept across rebuilds, so saving a page reparses only what changed.
+        self._cache        = create_cache(cache_size)
+        self._template     = load_template(template_path)
+        self._manifest     = Manifest.load(output_dir / MANIFEST_NAME)
+
+    def rebuild_all(self) -> None:
+        self.save()
+        try:
+            build_site(self.content_dir, self.output_dir, self.template_path, self.workers, cache_size=self.cache_size)
+        finally:
+            # Reloaded even when a page fails, so later single page rebuilds
+            # use the current template.
+            self._template = load_template(self.template_path)
+            self._manifest = Manifest.load(self.output_dir / MANIFEST_NAME)
+
+    def handle(self, changed: set[str] | None) -> list[str]:
+        content_root = os.path.abspath(self.content_dir)
+        if changed is None or os.path.abspath(self.template_path) in changed:
+            try:
+                self.rebuild_all()
+                return ["*"]
+            except (OSError, ValueError) as error:
+                print(f"error: {error}")
+            # A broken page stopped the full build; the others are rebuilt
+            # one by one so they still pick up the current template.
+            changed = {os.path.join(content_root, name) for name in find_pages(self.content_dir) + list(self._manifest.sources)}
+            force = True
+        else:
+            force = False
+
+        rebuilt = []
+        for path in sorted(changed):
+            if not path.endswith(".md") or os.path.commonpath([content_root, path]) != content_root:
+                continue
+            name = os.path.relpath(path, content_root).replace(os.sep, "/")
+            # A broken page is reported and its last good output kept; the
+            # rest of the batch is still rebuilt, as its events have been consumed.
+            try:
+                if self.rebuild_page(name, force):
+                    rebuilt.append(name)
+            except (OSError, ValueError) as error:
+                print(f"error: {error}")
+        return rebuilt
+
+    def rebuild_page(self, name: str, force: bool = False) -> bool:
+        source, output = self.content_dir / name, output_name(name)
+        record = self._manifest.sources.get(name)
+        if not source.exists():
+            if record is None:
+                return False
+            (self.output_dir / record.output).unlink(missing_ok=True)
+            del self._manifest.sources[name]
+            return True
+
+        # Editors often save without changing anything; skip those writes.
+        # Pages are written atomically, so a matching digest means the output
+        # is complete.
+        if not force and record is not None and record.digest == file_digest(source) and (self.output_dir / output).exists():
+            return False
+        current = snapshot(source, output)
+        links = generate_page(source, self.output_dir / output, self._template, self._cache)
+        self._manifest.sources[name] = current._replace(links=links)
+        return True
+
+    def save(self) -> None:
+        self._manifest.save(self.output_dir / MANIFEST_NAME)
+
+
+def watch_site(
+    content_dir:   Path,
+    output_dir:    Path,
+    template_path: Path,
+    workers:       int | None = None,
+    cache_size:    int | None = None
+) -> None:
+    site = SiteWatcher(content_dir, output_dir, template_path, workers, cache_size)
+    watcher = create_watcher(content_dir, template_path)
+    print(f"watching {content_dir} and {template_path} ({type(watcher).__name__}), ctrl-c to stop")
+    site.handle(RESCAN)
+    try:
+        while True:
+            changed = watcher.changes(1.0)
+            if changed == set():
+                continue
+            start = time.perf_counter()
+            try:
+                rebuilt = site.handle(changed)
+            except (OSError, ValueError) as error:
+                print(f"error: {error}")
+                continue
+            if rebuilt:
+                print(f"rebuilt {', '.join(rebuilt)} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        site.save()